@@ -1,12 +1,20 @@
 """
 Framework-specific adaptors for richer instrumentation.
+
+Framework adaptors are imported lazily, so only the one you use is loaded.
 """
 
+from importlib import import_module
+
 from .base import BaseAdaptor
-from .crewai import CrewAIAdaptor
-from .langchain import LangChainAdaptor
-from .langgraph import LangGraphAdaptor
-from .autogen import AutoGenAdaptor
+
+# Adaptor name -> submodule that defines it
+_LAZY_ADAPTORS = {
+    "CrewAIAdaptor": ".crewai",
+    "LangChainAdaptor": ".langchain",
+    "LangGraphAdaptor": ".langgraph",
+    "AutoGenAdaptor": ".autogen",
+}
 
 __all__ = [
     "BaseAdaptor",
@@ -16,3 +24,16 @@ __all__ = [
     "AutoGenAdaptor",
 ]
 
+
+def __getattr__(name: str):
+    module_name = _LAZY_ADAPTORS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    adaptor = getattr(import_module(module_name, __name__), name)
+    globals()[name] = adaptor  # Cache so later lookups skip __getattr__
+    return adaptor
+
+
+def __dir__():
+    return sorted(__all__)
@@ -2,7 +2,41 @@
 AutoGen adaptor.
 """
 
-from .base import BaseAdaptor
+from weakref import WeakKeyDictionary
+
+from .base import BaseAdaptor, _find_method
+from ..capture import CaptureContext, _current_ctx_var
+
+
+def _make_reply_wrapper(original, agent_name: str, system_message: str = None):
+    """Wrap an AutoGen agent's reply method with agent span capture."""
+    
+    def wrapped_method(messages=None, sender=None, **kwargs):
+        # Single context lookup per call; no trace means no bookkeeping
+        ctx = _current_ctx_var.get() if CaptureContext._active_count else None
+        if ctx is None:
+            return original(messages=messages, sender=sender, **kwargs)
+        
+        # Extract last message safely
+        last_msg = None
+        if messages:
+            try:
+                last_msg = messages[-1] if isinstance(messages, list) else str(messages)[:100]
+            except (IndexError, TypeError):
+                pass
+        
+        ctx.start_agent_span(agent_name, system_message, last_msg)
+        
+        try:
+            reply = original(messages=messages, sender=sender, **kwargs)
+            ctx.end_agent_span(agent_name, output=reply)
+            return reply
+        except Exception as e:
+            ctx.end_agent_span(agent_name, error=str(e))
+            raise
+    
+    wrapped_method._agentra_wrapped = True
+    return wrapped_method
 
 
 class AutoGenAdaptor(BaseAdaptor):
@@ -32,6 +66,9 @@ class AutoGenAdaptor(BaseAdaptor):
         agentra.evaluate()
     """
     
+    # Agent type -> name of its reply method, filled on first instrumentation
+    _method_names: WeakKeyDictionary = WeakKeyDictionary()
+    
     def instrument(self, target) -> None:
         """
         Instrument AutoGen agents or group chat.
@@ -55,44 +92,19 @@ class AutoGenAdaptor(BaseAdaptor):
         # Try multiple possible method names
         methods_to_try = ['generate_reply', 'generate_response', 'reply']
         
-        for method_name in methods_to_try:
-            if not hasattr(agent, method_name):
-                continue
-            
-            try:
-                original_method = getattr(agent, method_name)
-                if not callable(original_method):
-                    continue
-                
-                def make_wrapper(original):
-                    def wrapped_method(messages=None, sender=None, **kwargs):
-                        agent_name = getattr(agent, "name", "agent")
-                        
-                        # Extract last message safely
-                        last_msg = None
-                        if messages:
-                            try:
-                                last_msg = messages[-1] if isinstance(messages, list) else str(messages)[:100]
-                            except (IndexError, TypeError):
-                                pass
-                        
-                        self.on_agent_start(
-                            name=agent_name,
-                            role=getattr(agent, "system_message", None),
-                            input=last_msg
-                        )
-                        
-                        try:
-                            reply = original(messages=messages, sender=sender, **kwargs)
-                            self.on_agent_end(name=agent_name, output=reply)
-                            return reply
-                        except Exception as e:
-                            self.on_agent_end(name=agent_name, error=str(e))
-                            raise
-                    return wrapped_method
-                
-                setattr(agent, method_name, make_wrapper(original_method))
-                break  # Successfully patched
-            except (AttributeError, TypeError):
-                continue
+        # Agent identity is fixed for its lifetime; resolve it once, not per call
+        agent_name = getattr(agent, "name", "agent")
+        system_message = getattr(agent, "system_message", None)
+        
+        method_name, original_method = _find_method(agent, methods_to_try, self._method_names)
+        if original_method is None:
+            return
+        
+        if getattr(original_method, "_agentra_wrapped", False):
+            return  # Already instrumented
+        
+        try:
+            setattr(agent, method_name, _make_reply_wrapper(original_method, agent_name, system_message))
+        except (AttributeError, TypeError):
+            pass
 
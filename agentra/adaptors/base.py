@@ -2,12 +2,49 @@
 Base adaptor class.
 """
 
-from abc import ABC, abstractmethod
-from typing import Any
-from ..capture import CaptureContext
+from typing import Any, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+from ..capture import CaptureContext, _current_ctx_var, _intern
+
+if TYPE_CHECKING:
+    from typing import Protocol
+    from ..agentra import Agentra
+    
+    class Instrumentable(Protocol):
+        """Static interface every adaptor implements."""
+        
+        def instrument(self, target) -> None: ...
+
+
+_MISS = object()
+
+
+def _find_method(agent, candidates: list[str], cache: WeakKeyDictionary):
+    """
+    Find the first callable method on agent among candidates.
+    
+    The winning name is cached per agent type so later agents of the same
+    class skip the probe. Returns (name, method) or (None, None).
+    """
+    cls = type(agent)
+    
+    name = cache.get(cls)
+    if name is not None:
+        method = getattr(agent, name, _MISS)
+        if method is not _MISS and callable(method):
+            return name, method
+    
+    for name in candidates:
+        method = getattr(agent, name, _MISS)
+        if method is _MISS or not callable(method):
+            continue
+        cache[cls] = name
+        return name, method
+    
+    return None, None
 
 
-class BaseAdaptor(ABC):
+class BaseAdaptor:
     """
     Base class for framework-specific adaptors.
     
@@ -18,7 +55,6 @@ class BaseAdaptor(ABC):
     def __init__(self, agentra: "Agentra"):
         self.agentra = agentra
     
-    @abstractmethod
     def instrument(self, target) -> None:
         """
         Instrument a framework object (Crew, Chain, Graph, etc.)
@@ -28,29 +64,37 @@ class BaseAdaptor(ABC):
         - Task/node transitions
         - Framework-specific events
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} must implement instrument()")
     
     def on_agent_start(self, name: str, role: str = None, input: Any = None):
         """Called when an agent starts."""
-        ctx = CaptureContext.get_current()
+        if not CaptureContext._active_count:
+            return
+        ctx = _current_ctx_var.get()
         if ctx:
             ctx.start_agent_span(name, role, input)
     
     def on_agent_end(self, name: str, output: Any = None, error: str = None):
         """Called when an agent ends."""
-        ctx = CaptureContext.get_current()
+        if not CaptureContext._active_count:
+            return
+        ctx = _current_ctx_var.get()
         if ctx:
             ctx.end_agent_span(name, output, error)
     
     def on_task_start(self, task_name: str, task_input: Any = None):
         """Called when a task starts."""
-        ctx = CaptureContext.get_current()
+        if not CaptureContext._active_count:
+            return
+        ctx = _current_ctx_var.get()
         if ctx:
-            ctx.add_event("task_start", {"name": task_name, "input": task_input})
+            ctx.add_event("task_start", {"name": _intern(task_name), "input": task_input})
     
     def on_task_end(self, task_name: str, task_output: Any = None):
         """Called when a task ends."""
-        ctx = CaptureContext.get_current()
+        if not CaptureContext._active_count:
+            return
+        ctx = _current_ctx_var.get()
         if ctx:
-            ctx.add_event("task_end", {"name": task_name, "output": task_output})
+            ctx.add_event("task_end", {"name": _intern(task_name), "output": task_output})
 
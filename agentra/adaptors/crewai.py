@@ -2,7 +2,40 @@
 CrewAI adaptor.
 """
 
-from .base import BaseAdaptor
+from weakref import WeakKeyDictionary
+
+from .base import BaseAdaptor, _find_method
+from ..capture import CaptureContext, _current_ctx_var
+
+
+def _make_execute_wrapper(original, agent_name: str, agent_role: str = None):
+    """Wrap a CrewAI agent's execute method with agent span capture."""
+    
+    def wrapped_execute(task, *args, **kwargs):
+        # Single context lookup per call; no trace means no bookkeeping
+        ctx = _current_ctx_var.get() if CaptureContext._active_count else None
+        if ctx is None:
+            return original(task, *args, **kwargs)
+        
+        # Handle task input safely
+        task_input = None
+        if hasattr(task, "description"):
+            task_input = task.description
+        elif isinstance(task, str):
+            task_input = task[:100]
+        
+        ctx.start_agent_span(agent_name, agent_role, task_input)
+        
+        try:
+            result = original(task, *args, **kwargs)
+            ctx.end_agent_span(agent_name, output=result)
+            return result
+        except Exception as e:
+            ctx.end_agent_span(agent_name, error=str(e))
+            raise
+    
+    wrapped_execute._agentra_wrapped = True
+    return wrapped_execute
 
 
 class CrewAIAdaptor(BaseAdaptor):
@@ -29,6 +62,9 @@ class CrewAIAdaptor(BaseAdaptor):
         agentra.evaluate()
     """
     
+    # Agent type -> name of its execute method, filled on first instrumentation
+    _method_names: WeakKeyDictionary = WeakKeyDictionary()
+    
     def instrument(self, crew) -> None:
         """Instrument a CrewAI Crew instance."""
         
@@ -69,43 +105,19 @@ class CrewAIAdaptor(BaseAdaptor):
         # Try multiple possible method names based on CrewAI version
         methods_to_try = ['execute_task', 'execute', 'run']
         
-        for method_name in methods_to_try:
-            if not hasattr(agent, method_name):
-                continue
-            
-            try:
-                original_method = getattr(agent, method_name)
-                if not callable(original_method):
-                    continue
-                
-                def make_wrapper(original):
-                    def wrapped_execute(task, *args, **kwargs):
-                        agent_name = getattr(agent, "role", getattr(agent, "name", "agent"))
-                        
-                        # Handle task input safely
-                        task_input = None
-                        if hasattr(task, "description"):
-                            task_input = task.description
-                        elif isinstance(task, str):
-                            task_input = task[:100]
-                        
-                        self.on_agent_start(
-                            name=agent_name,
-                            role=getattr(agent, "role", None),
-                            input=task_input
-                        )
-                        
-                        try:
-                            result = original(task, *args, **kwargs)
-                            self.on_agent_end(name=agent_name, output=result)
-                            return result
-                        except Exception as e:
-                            self.on_agent_end(name=agent_name, error=str(e))
-                            raise
-                    return wrapped_execute
-                
-                setattr(agent, method_name, make_wrapper(original_method))
-                break  # Successfully patched
-            except (AttributeError, TypeError):
-                continue
+        # Agent identity is fixed for its lifetime; resolve it once, not per call
+        agent_name = getattr(agent, "role", getattr(agent, "name", "agent"))
+        agent_role = getattr(agent, "role", None)
+        
+        method_name, original_method = _find_method(agent, methods_to_try, self._method_names)
+        if original_method is None:
+            return
+        
+        if getattr(original_method, "_agentra_wrapped", False):
+            return  # Already instrumented by an earlier kickoff
+        
+        try:
+            setattr(agent, method_name, _make_execute_wrapper(original_method, agent_name, agent_role))
+        except (AttributeError, TypeError):
+            pass
 
@@ -4,6 +4,32 @@ LangChain adaptor.
 
 from .base import BaseAdaptor
 
+try:
+    from langchain_core.callbacks import BaseCallbackHandler as _BASE_CB
+except ImportError:
+    _BASE_CB = None
+
+
+def _with_handler(config, handler) -> dict:
+    """
+    Return a config whose callbacks include handler.
+    
+    The caller's config is never mutated; a shallow copy is made only when
+    the handler is missing, so reusing one config dict across invocations
+    does not grow its callback list.
+    """
+    config = config or {}
+    callbacks = config.get("callbacks") or []
+    
+    if not isinstance(callbacks, (list, tuple)):
+        # A CallbackManager was passed; leave it untouched
+        return config
+    
+    if handler in callbacks:
+        return config
+    
+    return {**config, "callbacks": [*callbacks, handler]}
+
 
 class LangChainCallbackHandler:
     """LangChain callback handler that feeds into Agentra."""
@@ -33,6 +59,30 @@ class LangChainCallbackHandler:
         self.adaptor.on_task_end("retriever", f"{doc_count} docs")
 
 
+if _BASE_CB is not None:
+    
+    class _AgentraCallbackHandler(_BASE_CB):
+        """LangChain-native callback handler that feeds into Agentra."""
+        
+        def __init__(self, adaptor: "LangChainAdaptor"):
+            super().__init__()
+            self.adaptor = adaptor
+        
+        def on_chain_start(self, serialized, inputs, **kwargs):
+            chain_name = serialized.get("name", "chain") if isinstance(serialized, dict) else "chain"
+            self.adaptor.on_agent_start(chain_name, input=inputs)
+        
+        def on_chain_end(self, outputs, **kwargs):
+            self.adaptor.on_agent_end("chain", output=outputs)
+        
+        def on_tool_start(self, serialized, input_str, **kwargs):
+            tool_name = serialized.get("name", "tool") if isinstance(serialized, dict) else "tool"
+            self.adaptor.on_task_start(tool_name, input_str)
+        
+        def on_tool_end(self, output, **kwargs):
+            self.adaptor.on_task_end("tool", output)
+
+
 class LangChainAdaptor(BaseAdaptor):
     """
     Adaptor for LangChain.
@@ -53,34 +103,19 @@ class LangChainAdaptor(BaseAdaptor):
         chain.invoke(input)
     """
     
+    def __init__(self, agentra: "Agentra"):
+        super().__init__(agentra)
+        self._handler = None
+    
     def get_callback_handler(self):
         """Get callback handler to pass to LangChain."""
-        try:
-            from langchain_core.callbacks import BaseCallbackHandler
-            
-            class AgentraCallbackHandler(BaseCallbackHandler):
-                def __init__(self, adaptor):
-                    super().__init__()
-                    self.adaptor = adaptor
-                
-                def on_chain_start(self, serialized, inputs, **kwargs):
-                    chain_name = serialized.get("name", "chain") if isinstance(serialized, dict) else "chain"
-                    self.adaptor.on_agent_start(chain_name, input=inputs)
-                
-                def on_chain_end(self, outputs, **kwargs):
-                    self.adaptor.on_agent_end("chain", output=outputs)
-                
-                def on_tool_start(self, serialized, input_str, **kwargs):
-                    tool_name = serialized.get("name", "tool") if isinstance(serialized, dict) else "tool"
-                    self.adaptor.on_task_start(tool_name, input_str)
-                
-                def on_tool_end(self, output, **kwargs):
-                    self.adaptor.on_task_end("tool", output)
-            
-            return AgentraCallbackHandler(self)
-        except ImportError:
-            # Fallback to simple callback
-            return LangChainCallbackHandler(self)
+        if self._handler is None:
+            if _BASE_CB is not None:
+                self._handler = _AgentraCallbackHandler(self)
+            else:
+                # Fallback to simple callback
+                self._handler = LangChainCallbackHandler(self)
+        return self._handler
     
     def instrument(self, chain) -> None:
         """Instrument a LangChain chain/agent."""
@@ -102,10 +137,7 @@ class LangChainAdaptor(BaseAdaptor):
         handler = self.get_callback_handler()
         
         def wrapped_method(input, config=None, **kwargs):
-            config = config or {}
-            callbacks = config.get("callbacks", [])
-            callbacks.append(handler)
-            config["callbacks"] = callbacks
+            config = _with_handler(config, handler)
             
             with self.agentra.trace():
                 return original_method(input, config=config, **kwargs)
@@ -37,24 +37,21 @@ class LangGraphAdaptor(BaseAdaptor):
         
         original_invoke = app.invoke
         
+        # LangGraph uses LangChain-style callbacks; build the handler once
+        try:
+            from .langchain import LangChainAdaptor, _with_handler
+            handler = LangChainAdaptor(self.agentra).get_callback_handler()
+        except Exception:
+            handler = None
+        
         def wrapped_invoke(input, config=None, **kwargs):
             with self.agentra.trace():
                 # Track node executions via config
-                config = config or {}
-                
-                # LangGraph uses LangChain-style callbacks
-                try:
-                    from .langchain import LangChainAdaptor
-                    langchain_adaptor = LangChainAdaptor(self.agentra)
-                    handler = langchain_adaptor.get_callback_handler()
-                    
-                    callbacks = config.get("callbacks", [])
-                    callbacks.append(handler)
-                    config["callbacks"] = callbacks
-                except:
-                    pass
+                if handler is not None:
+                    config = _with_handler(config, handler)
+                else:
+                    config = config or {}
                 
                 return original_invoke(input, config=config, **kwargs)
         
         app.invoke = wrapped_invoke
-
@@ -2,16 +2,30 @@
 Main Agentra class - primary interface for agent instrumentation.
 """
 
+import asyncio
 import random
+from collections import deque
+from concurrent.futures import Future
 from functools import wraps
-from typing import Callable, Any, Optional
+from typing import Awaitable, Callable, Any, Optional
 from contextlib import contextmanager
 
 from .types import Trace, EvaluationResult
 from .capture import CaptureContext
 from .evaluate import Evaluator
 from .report import print_report, generate_summary
-from .results import save_result, load_result, list_results, compare_results
+from .results import (
+    save_result,
+    save_result_async,
+    load_result,
+    list_results,
+    compare_results,
+    _json_default,
+)
+
+
+# LLM client patching only needs to happen once per process
+_patches_applied = False
 
 
 class Agentra:
@@ -38,6 +52,7 @@ class Agentra:
         auto_patch: bool = True,
         sample_rate: float = 1.0,
         results_dir: str = "agentra-results",
+        max_traces: Optional[int] = None,
     ):
         """
         Initialize Agentra.
@@ -48,6 +63,7 @@ class Agentra:
             auto_patch: Whether to auto-patch LLM clients
             sample_rate: Fraction of runs to capture (for production)
             results_dir: Directory to save results
+            max_traces: Keep only the most recent N traces (None = unbounded)
         """
         self.name = name
         self.description = description
@@ -55,22 +71,47 @@ class Agentra:
         self.results_dir = results_dir
         
         # Storage for captured traces
-        self._traces: list[Trace] = []
+        self._traces: deque[Trace] = deque(maxlen=max_traces)
         
         # Latest evaluation result
         self._latest_result: Optional[EvaluationResult] = None
         
+        # (result, summary) for the last result summarized
+        self._summary_cache: Optional[tuple[EvaluationResult, str]] = None
+        
         # Auto-patch LLM clients
         if auto_patch:
             self._apply_patches()
     
-    def _apply_patches(self):
-        """Apply auto-patching to LLM clients."""
+    @property
+    def sample_rate(self) -> float:
+        return self._sample_rate
+    
+    @sample_rate.setter
+    def sample_rate(self, rate: float):
+        # Precompute the sampling gate so wrappers never touch floats per call
+        self._sample_rate = rate
+        self._sample_always = rate >= 1.0
+        self._sample_threshold = int(min(max(rate, 0.0), 1.0) * (1 << 32))
+    
+    def _apply_patches(self, force: bool = False):
+        """
+        Apply auto-patching to LLM clients.
+        
+        Runs once per process; pass force=True to re-apply (e.g. after
+        calling the unpatch_* helpers in tests).
+        """
+        global _patches_applied
+        
+        if _patches_applied and not force:
+            return
+        
         try:
             from .patches import patch_openai, patch_anthropic, patch_litellm
             patch_openai()
             patch_anthropic()
             patch_litellm()
+            _patches_applied = True
         except Exception as e:
             # Silently fail if patches can't be applied
             pass
@@ -83,11 +124,12 @@ class Agentra:
         def my_agent(query):
             ...
         """
+        getrandbits = random.getrandbits
         
         @wraps(fn)
         def wrapper(*args, **kwargs):
-            # Sample check
-            if random.random() > self.sample_rate:
+            # Sample check (read per call, so changes to sample_rate apply)
+            if not self._sample_always and getrandbits(32) >= self._sample_threshold:
                 return fn(*args, **kwargs)
             
             # Create capture context
@@ -135,14 +177,16 @@ class Agentra:
         """
         ctx = CaptureContext.get_current()
         
-        if ctx:
-            ctx.start_agent_span(name, role)
+        if ctx is None:
+            # Not inside a trace - nothing to record
+            yield
+            return
         
+        ctx.start_agent_span(name, role)
         try:
             yield
         finally:
-            if ctx:
-                ctx.end_agent_span(name)
+            ctx.end_agent_span(name)
     
     # ─────────────────────────────────────────────────────────────
     # Results
@@ -168,12 +212,59 @@ class Agentra:
         self._latest_result = result
         return result
     
+    async def evaluate_async(self, config: dict = None, concurrency: int = None) -> EvaluationResult:
+        """
+        Evaluate all captured traces concurrently.
+        
+        Args:
+            config: Optional evaluation config (weights, thresholds, etc.)
+            concurrency: Maximum number of evaluations in flight
+                (defaults to config["max_concurrency"], or 8)
+        
+        Returns:
+            EvaluationResult
+        """
+        evaluator = Evaluator(config)
+        result = await evaluator.evaluate_async(
+            traces=list(self._traces),
+            system_name=self.name,
+            system_description=self.description,
+            concurrency=concurrency,
+        )
+        
+        self._latest_result = result
+        return result
+    
+    async def run_batch(self, calls: list[Awaitable], return_exceptions: bool = False) -> list:
+        """
+        Run many async agent calls concurrently, one trace each.
+        
+        results = await agentra.run_batch([my_agent(q) for q in queries])
+        """
+        
+        async def traced(call: Awaitable) -> Any:
+            # Each gathered task has its own context, so traces stay separate
+            with self.trace() as ctx:
+                result = await call
+                ctx.set_output(result)
+                return result
+        
+        return await asyncio.gather(
+            *(traced(c) for c in calls),
+            return_exceptions=return_exceptions,
+        )
+    
     def summary(self) -> str:
         """Quick one-line summary."""
         if not self._latest_result:
             return f"No evaluation yet. {len(self._traces)} traces captured."
         
-        return generate_summary(self._latest_result)
+        cache = self._summary_cache
+        if cache is None or cache[0] is not self._latest_result:
+            cache = (self._latest_result, generate_summary(self._latest_result))
+            self._summary_cache = cache
+        
+        return cache[1]
     
     def report(self):
         """Print detailed report to console."""
@@ -200,6 +291,19 @@ class Agentra:
         filepath = save_result(self._latest_result, name, self.results_dir)
         return filepath
     
+    def save_async(self, name: str) -> "Future[str]":
+        """
+        Like save(), but writes the file on a background thread.
+        
+        Returns:
+            Future resolving to the path of the saved file
+        """
+        if not self._latest_result:
+            # Auto-evaluate if not done yet
+            self._latest_result = self.evaluate()
+        
+        return save_result_async(self._latest_result, name, self.results_dir)
+    
     @staticmethod
     def load(name: str, results_dir: str = "agentra-results") -> EvaluationResult:
         """Load previously saved results."""
@@ -221,41 +325,84 @@ class Agentra:
     
     def get_traces(self) -> list[Trace]:
         """Get all captured traces."""
-        return self._traces.copy()
+        return list(self._traces)
     
     def clear(self):
         """Clear captured traces."""
-        self._traces = []
+        self._traces.clear()
         self._latest_result = None
+        self._summary_cache = None
     
     def coverage(self) -> dict:
         """Get coverage report - what agents/tools were exercised."""
         agents = set()
         tools = set()
+        llm_calls = 0
+        tool_calls = 0
         
+        # Single pass over traces gathers everything
         for trace in self._traces:
-            agents.update(span.name for span in trace.agent_spans)
-            tools.update(tc.name for tc in trace.tool_calls)
+            # Prefer the name columns; fall back for traces built by hand
+            if len(trace._agent_span_names) == len(trace.agent_spans):
+                agents.update(trace._agent_span_names)
+            else:
+                agents.update(span.name for span in trace.agent_spans)
+            
+            if len(trace._tool_call_names) == len(trace.tool_calls):
+                tools.update(trace._tool_call_names)
+            else:
+                tools.update(tc.name for tc in trace.tool_calls)
+            
+            llm_calls += len(trace.llm_calls)
+            tool_calls += len(trace.tool_calls)
         
         return {
             "agents": list(agents),
             "tools": list(tools),
             "traces": len(self._traces),
-            "llm_calls": sum(len(t.llm_calls) for t in self._traces),
-            "tool_calls": sum(len(t.tool_calls) for t in self._traces),
+            "llm_calls": llm_calls,
+            "tool_calls": tool_calls,
         }
     
     def export(self, path: str):
         """Export traces to JSON file."""
-        import json
-        from dataclasses import asdict
-        
         data = {
             "system_name": self.name,
             "system_description": self.description,
-            "traces": [asdict(t) for t in self._traces],
+            "traces": list(self._traces),
         }
         
+        try:
+            import orjson
+        except ImportError:
+            orjson = None
+        
+        if orjson is not None:
+            # Dataclasses and datetimes go through _json_default, as with
+            # stdlib json: agent spans are written with their resolved calls
+            # and datetimes in str() form, whichever encoder runs. Each
+            # dataclass is still expanded only as orjson reaches it
+            try:
+                payload = orjson.dumps(
+                    data,
+                    default=_json_default,
+                    option=(
+                        orjson.OPT_INDENT_2
+                        | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_PASSTHROUGH_DATACLASS
+                        | orjson.OPT_PASSTHROUGH_DATETIME
+                    ),
+                )
+            except TypeError:
+                # Fall back to stdlib for values orjson rejects (e.g. huge ints)
+                payload = None
+            
+            if payload is not None:
+                with open(path, "wb") as f:
+                    f.write(payload)
+                return
+        
+        import json
+        
         with open(path, "w") as f:
-            json.dump(data, f, indent=2, default=str)
-
+            json.dump(data, f, indent=2, default=_json_default)
@@ -5,26 +5,49 @@ Uses contextvars to track current trace across async boundaries.
 
 from contextvars import ContextVar
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timedelta
+import sys
+import threading
 import uuid
 import time
 
 from .types import Trace, LLMCall, ToolCall, AgentSpan
 
 
-# Current trace being recorded
-_current_context: ContextVar[Optional["CaptureContext"]] = ContextVar(
+# Current trace being recorded. Hot paths read this directly rather than
+# going through CaptureContext.get_current().
+_current_ctx_var: ContextVar[Optional["CaptureContext"]] = ContextVar(
     "agentra_context", default=None
 )
 
 
+def _intern(name):
+    """Intern exact str names; the same few agent/tool names recur constantly."""
+    return sys.intern(name) if type(name) is str else name
+
+
 class CaptureContext:
     """
     Context for capturing a single trace.
     
     Used internally by Agentra.wrap and agentra.trace()
+    
+    The current context lives in a ContextVar rather than a thread-local
+    stack: setting it is a cheap persistent-map insert, and it is what lets
+    each asyncio task (e.g. Agentra.run_batch) see its own trace. Entering a
+    context that is already current skips the set entirely.
     """
     
+    __slots__ = (
+        "trace", "_agent_stack", "_token", "_depth", "_t0_ns", "_wall_start",
+        "_event_types", "_event_data", "_event_ns",
+    )
+    
+    # Number of contexts currently entered in any thread. Hot callbacks read
+    # this first so they cost a single attribute load when nothing is traced.
+    _active_count: int = 0
+    _active_lock = threading.Lock()
+    
     def __init__(self, name: str = None):
         self.trace = Trace(
             id=str(uuid.uuid4()),
@@ -32,28 +55,60 @@ class CaptureContext:
         )
         self._agent_stack: list[AgentSpan] = []
         self._token = None
-        self._start_time = None
+        self._depth = 0  # Nested re-entries of this context while current
+        
+        # Timing is measured on the monotonic clock; wall-clock datetimes are
+        # derived from the single datetime read at the start of the trace
+        self._t0_ns = time.monotonic_ns()
+        self._wall_start = self.trace.start_time
+        
+        # Generic events, buffered column-wise and written to
+        # trace.metadata["events"] when the context exits
+        self._event_types: list[str] = []
+        self._event_data: list[dict] = []
+        self._event_ns: list[int] = []
     
     def __enter__(self):
-        self._token = _current_context.set(self)
-        self._start_time = time.time()
-        self.trace.start_time = datetime.now()
+        with CaptureContext._active_lock:
+            CaptureContext._active_count += 1
+        
+        # Re-entered while already current: keep the outer token and timing
+        if _current_ctx_var.get() is self:
+            self._depth += 1
+            return self
+        
+        self._token = _current_ctx_var.set(self)
+        self._t0_ns = time.monotonic_ns()
+        self._wall_start = self.trace.start_time = datetime.now()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        end_time = time.time()
-        self.trace.end_time = datetime.now()
-        self.trace.duration_ms = (end_time - self._start_time) * 1000
+        if self._depth:
+            self._depth -= 1
+            if exc_val:
+                self.trace.error = str(exc_val)
+            with CaptureContext._active_lock:
+                CaptureContext._active_count -= 1
+            return
+        
+        elapsed_ns = time.monotonic_ns() - self._t0_ns
+        self.trace.end_time = self._wall_time(elapsed_ns)
+        self.trace.duration_ms = elapsed_ns / 1_000_000
         
         if exc_val:
             self.trace.error = str(exc_val)
         
-        _current_context.reset(self._token)
+        if self._event_types:
+            self._flush_events()
+        
+        _current_ctx_var.reset(self._token)
+        with CaptureContext._active_lock:
+            CaptureContext._active_count -= 1
     
     @staticmethod
     def get_current() -> Optional["CaptureContext"]:
         """Get current capture context (if any)."""
-        return _current_context.get()
+        return _current_ctx_var.get()
     
     def set_input(self, input):
         self.trace.input = input
@@ -62,37 +117,63 @@ class CaptureContext:
         self.trace.output = output
     
     def add_llm_call(self, call: LLMCall):
-        self.trace.llm_calls.append(call)
+        llm_calls = self.trace.llm_calls
         
-        # Also add to current agent span if any
-        if self._agent_stack:
-            self._agent_stack[-1].llm_calls.append(call)
+        # Also record its position on the current agent span if any
+        stack = self._agent_stack
+        if stack:
+            stack[-1].llm_call_indices.append(len(llm_calls))
+        llm_calls.append(call)
     
     def add_tool_call(self, call: ToolCall):
-        self.trace.tool_calls.append(call)
+        call.name = _intern(call.name)
+        trace = self.trace
+        tool_calls = trace.tool_calls
         
-        if self._agent_stack:
-            self._agent_stack[-1].tool_calls.append(call)
+        stack = self._agent_stack
+        if stack:
+            stack[-1].tool_call_indices.append(len(tool_calls))
+        tool_calls.append(call)
+        trace._tool_call_names.append(call.name)
     
     def start_agent_span(self, name: str, role: str = None, input=None):
+        name = _intern(name)
         span = AgentSpan(name=name, role=role, input=input)
+        span._trace = self.trace
         self._agent_stack.append(span)
         self.trace.agent_spans.append(span)
+        self.trace._agent_span_names.append(name)
     
     def end_agent_span(self, name: str, output=None, error: str = None):
         if self._agent_stack and self._agent_stack[-1].name == name:
             span = self._agent_stack.pop()
-            span.end_time = datetime.now()
+            span.end_time = self._wall_time(time.monotonic_ns() - self._t0_ns)
             span.output = output
             span.error = error
     
+    def _wall_time(self, elapsed_ns: int) -> datetime:
+        """Wall-clock time `elapsed_ns` after the trace started."""
+        return self._wall_start + timedelta(microseconds=elapsed_ns // 1000)
+    
     def add_event(self, event_type: str, data: dict):
-        """Add generic event to trace metadata."""
-        if "events" not in self.trace.metadata:
-            self.trace.metadata["events"] = []
-        self.trace.metadata["events"].append({
-            "type": event_type,
-            "data": data,
-            "timestamp": time.time(),
-        })
+        """Add generic event to trace metadata (visible once the context exits)."""
+        self._event_types.append(event_type)
+        self._event_data.append(data)
+        self._event_ns.append(time.monotonic_ns())
+    
+    def _flush_events(self):
+        """Materialize buffered events as {type, data, timestamp} dicts."""
+        # Epoch seconds, as time.time() would have returned at each event
+        epoch_start = self._wall_start.timestamp()
+        t0_ns = self._t0_ns
+        
+        events = self.trace.metadata.setdefault("events", [])
+        events.extend(
+            {"type": t, "data": d, "timestamp": epoch_start + (ns - t0_ns) / 1e9}
+            for t, d, ns in zip(self._event_types, self._event_data, self._event_ns)
+        )
+        
+        self._event_types.clear()
+        self._event_data.clear()
+        self._event_ns.clear()
 
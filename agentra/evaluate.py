@@ -3,7 +3,12 @@ Evaluation orchestrator.
 Runs all evaluators on traces and aggregates results.
 """
 
+import asyncio
+from itertools import chain, islice
+from typing import Callable, Iterable, Optional
+
 from .types import Trace, EvaluationResult, CategoryResult, TraceResult, Status
+from .evaluators.base import _as_text, _text_cache
 from .evaluators import (
     FunctionalEvaluator,
     ReasoningEvaluator,
@@ -25,6 +30,59 @@ DEFAULT_WEIGHTS = {
 }
 
 
+# Length of the input/output previews stored on each TraceResult
+_PREVIEW_CHARS = 100
+
+
+def _preview(value, n: int = _PREVIEW_CHARS) -> str:
+    """First n characters of str() of a trace input/output, for display."""
+    if not value:
+        return ""
+    # Strings are sliced as-is; anything else shares the memoized str()
+    # the evaluators already built for it
+    return _as_text(value)[:n]
+
+
+class _RunningTotals:
+    """
+    Aggregates for an evaluation run, updated one trace at a time so that
+    per-trace results need not be kept around.
+    """
+    
+    def __init__(self, evaluators: list):
+        self.evaluator_names = [e.name for e in evaluators]
+        self.category_sums = dict.fromkeys(self.evaluator_names, 0.0)
+        self.category_counts = dict.fromkeys(self.evaluator_names, 0)
+        
+        # Insertion-ordered sets (dict keys) of everything seen so far
+        self.issues = {}
+        self.agents_observed = {}
+        self.tools_observed = {}
+        
+        self.total_traces = 0
+        self.total_llm_calls = 0
+        self.total_tool_calls = 0
+        self.total_tokens = 0
+        self.total_duration_ms = 0
+    
+    def add(self, trace: Trace, trace_result: TraceResult):
+        for name, cat in zip(self.evaluator_names, trace_result.categories):
+            self.category_sums[name] += cat.score
+            self.category_counts[name] += 1
+        
+        self.issues.update(dict.fromkeys(trace_result.issues))
+        
+        self.total_traces += 1
+        self.total_llm_calls += len(trace.llm_calls)
+        self.total_tool_calls += len(trace.tool_calls)
+        self.total_tokens += trace.total_tokens
+        self.total_duration_ms += trace.duration_ms
+        for s in trace.agent_spans:
+            self.agents_observed[s.name] = None
+        for tc in trace.tool_calls:
+            self.tools_observed[tc.name] = None
+
+
 class Evaluator:
     """Orchestrates evaluation across all categories."""
     
@@ -56,45 +114,230 @@ class Evaluator:
             # Return empty result
             return self._empty_result(system_name)
         
-        # Evaluate each trace
-        trace_results = []
-        all_category_scores = {e.name: [] for e in self.evaluators}
+        trace_results = self._evaluate_traces(traces, system_description)
+        
+        return self._aggregate(traces, trace_results, system_name)
+    
+    def evaluate_stream(
+        self,
+        traces: Iterable[Trace],
+        system_name: str,
+        system_description: str = "",
+        on_result: Optional[Callable[[TraceResult], None]] = None,
+        batch_size: int = 64,
+    ) -> EvaluationResult:
+        """
+        Evaluate any number of traces in bounded memory.
         
-        for trace in traces:
-            trace_categories = []
+        Traces are consumed and judged batch_size at a time. Each TraceResult
+        is handed to on_result (e.g. to write it out) and then dropped, so the
+        returned result holds the aggregates only: trace_results is empty.
+        
+        Args:
+            traces: Any iterable of traces, e.g. a generator reading from disk
+            on_result: Called with every TraceResult as it is produced
+            batch_size: Traces judged together per batch
+        """
+        totals = _RunningTotals(self.evaluators)
+        
+        it = iter(traces)
+        while True:
+            batch = list(islice(it, batch_size))
+            if not batch:
+                break
             
-            for evaluator in self.evaluators:
-                cat_result = evaluator.evaluate(
-                    trace,
-                    system_description=system_description,
-                )
-                trace_categories.append(cat_result)
-                all_category_scores[evaluator.name].append(cat_result.score)
+            for trace, trace_result in zip(batch, self._evaluate_traces(batch, system_description)):
+                totals.add(trace, trace_result)
+                if on_result is not None:
+                    on_result(trace_result)
+        
+        if not totals.total_traces:
+            return self._empty_result(system_name)
+        
+        return self._finish(totals, [], system_name)
+    
+    def _evaluate_traces(self, traces: list[Trace], system_description: str) -> list[TraceResult]:
+        """Run every evaluator on a batch of traces."""
+        # Each trace's input/output is stringified once, however many
+        # evaluators read it
+        with _text_cache():
+            # Gather judge prompts from every evaluator on every trace so the
+            # judge receives them as a single batch
+            prompts = [self._prepare_prompts(trace, system_description) for trace in traces]
+            scores = self._score_prompts(prompts)
             
-            # Calculate trace score
-            trace_score = sum(
-                cat.score * self.weights.get(cat.name, 0.1)
-                for cat in trace_categories
+            # Evaluate each trace
+            return [
+                self._build_trace_result(trace, system_description, trace_scores)
+                for trace, trace_scores in zip(traces, scores)
+            ]
+    
+    async def evaluate_async(
+        self,
+        traces: list[Trace],
+        system_name: str,
+        system_description: str = "",
+        concurrency: int = None,
+    ) -> EvaluationResult:
+        """
+        Evaluate traces concurrently.
+        
+        Every (trace, evaluator) pair is dispatched through
+        BaseEvaluator.aevaluate, with at most `concurrency` in flight
+        (default: config["max_concurrency"], or 8) to respect judge rate
+        limits. Aggregation stays serial.
+        """
+        
+        if not traces:
+            return self._empty_result(system_name)
+        
+        if concurrency is None:
+            concurrency = self.config.get("max_concurrency", 8)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def run(evaluator, trace: Trace) -> CategoryResult:
+            if evaluator.skips(trace):
+                return evaluator.skipped_result(trace)
+            async with semaphore:
+                return await evaluator.aevaluate(trace, system_description)
+        
+        # Tasks and worker threads copy this context, so they share the memo
+        with _text_cache():
+            results = await asyncio.gather(
+                *(run(evaluator, trace) for trace in traces for evaluator in self.evaluators),
+                return_exceptions=True,
             )
             
-            trace_results.append(TraceResult(
-                trace_id=trace.id,
-                trace_name=trace.name,
-                score=trace_score,
-                categories=trace_categories,
-                issues=[i for c in trace_categories for i in c.issues],
-                input_preview=str(trace.input)[:100] if trace.input else "",
-                output_preview=str(trace.output)[:100] if trace.output else "",
-                duration_ms=trace.duration_ms,
-                llm_calls_count=len(trace.llm_calls),
-                tool_calls_count=len(trace.tool_calls),
-            ))
+            # Let every pair finish, then surface the first failure
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            
+            # Reshape the flat results back into per-trace category lists
+            n = len(self.evaluators)
+            trace_results = [
+                self._trace_result(trace, list(results[i * n:(i + 1) * n]))
+                for i, trace in enumerate(traces)
+            ]
+        
+        return self._aggregate(traces, trace_results, system_name)
+    
+    def _prepare_prompts(self, trace: Trace, system_description: str) -> list[dict]:
+        """
+        Judge prompts for one trace, one dict per evaluator (None for
+        evaluators that don't apply to the trace).
+        """
+        return [
+            evaluator.prepare_prompts(trace, system_description)
+            if not evaluator.skips(trace) else None
+            for evaluator in self.evaluators
+        ]
+    
+    def _score_prompts(self, prompts: list[list[dict]]) -> list[list[dict]]:
+        """
+        Score judge prompts for many traces in one batch.
+        
+        Takes prompts shaped [trace][evaluator] -> {check: kwargs} and returns
+        scores in the same shape, {check: Score}. Skipped evaluators stay None.
+        """
+        requests = [
+            [
+                None if evaluator_prompts is None else evaluator.judge_requests(evaluator_prompts)
+                for evaluator, evaluator_prompts in zip(self.evaluators, trace_prompts)
+            ]
+            for trace_prompts in prompts
+        ]
+        
+        # One batch per distinct judge (normally just the shared default).
+        # Judges are only resolved for evaluators that have prompts.
+        judges = {}  # evaluator index -> Judge
+        batches = {}  # id(judge) -> (judge, items)
+        for trace_requests in requests:
+            for i, evaluator_requests in enumerate(trace_requests):
+                if evaluator_requests:
+                    if i not in judges:
+                        judges[i] = self.evaluators[i]._judge()
+                    judge = judges[i]
+                    batch = batches.setdefault(id(judge), (judge, []))[1]
+                    batch.extend(item for _, item in evaluator_requests)
+        
+        results = {
+            key: iter(judge.evaluate_batch(items))
+            for key, (judge, items) in batches.items()
+        }
+        
+        return [
+            [
+                None if evaluator_requests is None else evaluator.collect_scores(
+                    evaluator_requests,
+                    [next(results[id(judges[i])]) for _ in evaluator_requests],
+                )
+                for i, (evaluator, evaluator_requests) in enumerate(zip(self.evaluators, trace_requests))
+            ]
+            for trace_requests in requests
+        ]
+    
+    def _build_trace_result(
+        self,
+        trace: Trace,
+        system_description: str,
+        scores: list[dict],
+    ) -> TraceResult:
+        """Assemble one trace's category results from its judge scores."""
+        trace_categories = [
+            evaluator.skipped_result(trace) if evaluator_scores is None
+            else evaluator.assemble_result(trace, system_description, evaluator_scores)
+            for evaluator, evaluator_scores in zip(self.evaluators, scores)
+        ]
         
+        return self._trace_result(trace, trace_categories)
+    
+    def _trace_result(self, trace: Trace, trace_categories: list[CategoryResult]) -> TraceResult:
+        """Score one trace from its category results."""
+        # Calculate trace score
+        trace_score = sum(
+            cat.score * self.weights.get(cat.name, 0.1)
+            for cat in trace_categories
+        )
+        
+        return TraceResult(
+            trace_id=trace.id,
+            trace_name=trace.name,
+            score=trace_score,
+            categories=trace_categories,
+            issues=list(chain.from_iterable(c.issues for c in trace_categories)),
+            input_preview=_preview(trace.input),
+            output_preview=_preview(trace.output),
+            duration_ms=trace.duration_ms,
+            llm_calls_count=len(trace.llm_calls),
+            tool_calls_count=len(trace.tool_calls),
+        )
+    
+    def _aggregate(
+        self,
+        traces: list[Trace],
+        trace_results: list[TraceResult],
+        system_name: str,
+    ) -> EvaluationResult:
+        """Combine per-trace results into an EvaluationResult."""
+        totals = _RunningTotals(self.evaluators)
+        for trace, trace_result in zip(traces, trace_results):
+            totals.add(trace, trace_result)
+        
+        return self._finish(totals, trace_results, system_name)
+    
+    def _finish(
+        self,
+        totals: "_RunningTotals",
+        trace_results: list[TraceResult],
+        system_name: str,
+    ) -> EvaluationResult:
+        """Build the EvaluationResult from running totals."""
         # Aggregate category scores
         aggregate_categories = []
         for evaluator in self.evaluators:
-            scores = all_category_scores[evaluator.name]
-            avg_score = sum(scores) / len(scores) if scores else 0
+            count = totals.category_counts[evaluator.name]
+            avg_score = totals.category_sums[evaluator.name] / count if count else 0
             
             aggregate_categories.append(CategoryResult(
                 name=evaluator.name,
@@ -119,12 +362,12 @@ class Evaluator:
         else:
             status = Status.POOR
         
-        # Collect all issues and generate recommendations
-        all_issues = list(set(i for tr in trace_results for i in tr.issues))
+        # Collect all issues (deduplicated, in first-seen order) and generate recommendations
+        all_issues = list(totals.issues)
         recommendations = self._generate_recommendations(aggregate_categories, all_issues)
         
         # Generate summary
-        summary = self._generate_summary(overall_score, status, traces, all_issues)
+        summary = self._generate_summary(overall_score, status, totals.total_traces, all_issues)
         
         return EvaluationResult(
             name="",  # Set when saving
@@ -136,17 +379,13 @@ class Evaluator:
             summary=summary,
             issues=all_issues,
             recommendations=recommendations,
-            total_traces=len(traces),
-            total_llm_calls=sum(len(t.llm_calls) for t in traces),
-            total_tool_calls=sum(len(t.tool_calls) for t in traces),
-            total_tokens=sum(t.total_tokens for t in traces),
-            total_duration_ms=sum(t.duration_ms for t in traces),
-            agents_observed=list(set(
-                s.name for t in traces for s in t.agent_spans
-            )),
-            tools_observed=list(set(
-                tc.name for t in traces for tc in t.tool_calls
-            )),
+            total_traces=totals.total_traces,
+            total_llm_calls=totals.total_llm_calls,
+            total_tool_calls=totals.total_tool_calls,
+            total_tokens=totals.total_tokens,
+            total_duration_ms=totals.total_duration_ms,
+            agents_observed=list(totals.agents_observed),
+            tools_observed=list(totals.tools_observed),
         )
     
     def _empty_result(self, system_name: str) -> EvaluationResult:
@@ -170,8 +409,8 @@ class Evaluator:
             tools_observed=[],
         )
     
-    def _generate_summary(self, score, status, traces, issues) -> str:
-        return f"{len(traces)} traces evaluated. Score: {score:.0%} ({status.value}). {len(issues)} issues found."
+    def _generate_summary(self, score, status, total_traces, issues) -> str:
+        return f"{total_traces} traces evaluated. Score: {score:.0%} ({status.value}). {len(issues)} issues found."
     
     def _generate_recommendations(self, categories, issues) -> list[str]:
         recommendations = []
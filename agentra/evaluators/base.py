@@ -2,8 +2,48 @@
 Base evaluator class.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from ..types import Trace, CategoryResult
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from ..types import Trace, CategoryResult, Score
+from ..judge import Judge
+
+
+# str() of trace inputs/outputs, memoized per object for one evaluation run
+_text_memo: ContextVar[Optional[dict]] = ContextVar("agentra_text_memo", default=None)
+
+
+@contextmanager
+def _text_cache():
+    """Share _as_text() results across evaluators for the duration of a run."""
+    token = _text_memo.set({})
+    try:
+        yield
+    finally:
+        _text_memo.reset(token)
+
+
+def _as_text(value) -> str:
+    """
+    str(value), computed once per object inside a _text_cache() block.
+    
+    Every evaluator stringifies the same trace input/output, which is costly
+    for large dicts or message lists.
+    """
+    if type(value) is str:
+        return value
+    
+    memo = _text_memo.get()
+    if memo is None:
+        return str(value)
+    
+    entry = memo.get(id(value))
+    if entry is None:
+        # Keep the object alive so its id can't be reused within the run
+        entry = memo[id(value)] = (value, str(value))
+    return entry[1]
 
 
 class BaseEvaluator(ABC):
@@ -11,6 +51,10 @@ class BaseEvaluator(ABC):
     
     name: str = "base"
     
+    # Send prompts that share input/output/context as one multi-criteria
+    # judge call (Judge.evaluate_multi) instead of one call per check
+    merge_prompts: bool = False
+    
     @abstractmethod
     def evaluate(self, trace: Trace, system_description: str = "") -> CategoryResult:
         """
@@ -24,4 +68,130 @@ class BaseEvaluator(ABC):
             CategoryResult with scores and issues
         """
         pass
-
+    
+    def applies_to(self, trace: Trace) -> bool:
+        """
+        Whether this evaluator has anything to check on the trace.
+        
+        When False, Evaluator uses skipped_result() instead of preparing
+        prompts and running the checks. Only honored for evaluators that
+        also override skipped_result(); others always run.
+        """
+        return True
+    
+    def skipped_result(self, trace: Trace) -> CategoryResult:
+        """Category result for a trace this evaluator doesn't apply to."""
+        raise NotImplementedError(f"{type(self).__name__} does not define a skipped result")
+    
+    def skips(self, trace: Trace) -> bool:
+        """Whether to use skipped_result() for the trace instead of running the checks."""
+        if type(self).skipped_result is BaseEvaluator.skipped_result:
+            return False
+        return not self.applies_to(trace)
+    
+    async def aevaluate(self, trace: Trace, system_description: str = "") -> CategoryResult:
+        """
+        Async variant of evaluate().
+        
+        Judge prompts from prepare_prompts() are sent through the judge's
+        async client and the result built with assemble_result(). Evaluators
+        without judge prompts run evaluate() in a worker thread.
+        """
+        prompts = self.prepare_prompts(trace, system_description)
+        if not prompts:
+            return await asyncio.to_thread(self.evaluate, trace, system_description)
+        
+        requests = self.judge_requests(prompts)
+        results = await self._judge().evaluate_many([item for _, item in requests])
+        scores = self.collect_scores(requests, results)
+        
+        return self.assemble_result(trace, system_description, scores)
+    
+    def prepare_prompts(self, trace: Trace, system_description: str = "") -> dict[str, dict]:
+        """
+        Judge prompts this evaluator needs for a trace.
+        
+        Returns:
+            Check name -> Judge.evaluate kwargs. Empty for evaluators
+            that don't use the judge.
+        """
+        return {}
+    
+    def assemble_result(
+        self,
+        trace: Trace,
+        system_description: str,
+        scores: dict[str, Score],
+    ) -> CategoryResult:
+        """
+        Build the category result once judge scores are available.
+        
+        Args:
+            scores: Check name -> Score for every prompt from prepare_prompts
+        """
+        return self.evaluate(trace, system_description=system_description)
+    
+    @classmethod
+    def _judge(cls) -> Judge:
+        """
+        Judge used for this evaluator's prompts.
+        
+        Lazily created and shared process-wide (see Judge.default()), so
+        SDK clients and connection pools are set up once. Override to use a
+        different model for one evaluator.
+        """
+        return Judge.default()
+    
+    def judge_requests(self, prompts: dict[str, dict]) -> list[tuple[list[str], dict]]:
+        """
+        Group prompts into judge requests.
+        
+        Returns:
+            (check names, Judge.evaluate_batch item) pairs. With merge_prompts,
+            checks sharing input/output/context become a single item whose
+            criteria is a {check: criteria} dict.
+        """
+        if not self.merge_prompts:
+            return [([check], kwargs) for check, kwargs in prompts.items()]
+        
+        groups: dict[tuple, dict[str, str]] = {}
+        for check, kwargs in prompts.items():
+            key = (kwargs["input"], kwargs["output"], kwargs.get("context", ""))
+            groups.setdefault(key, {})[check] = kwargs["criteria"]
+        
+        requests = []
+        for (input, output, context), criteria in groups.items():
+            if len(criteria) == 1:
+                check, = criteria
+                requests.append(([check], prompts[check]))
+            else:
+                requests.append((list(criteria), {
+                    "criteria": criteria,
+                    "input": input,
+                    "output": output,
+                    "context": context,
+                }))
+        return requests
+    
+    @staticmethod
+    def collect_scores(requests: list[tuple[list[str], dict]], results: list) -> dict[str, Score]:
+        """Map judge results for judge_requests() back to check name -> Score."""
+        scores = {}
+        for (checks, _), result in zip(requests, results):
+            if isinstance(result, dict):
+                scores.update(result)
+            else:
+                scores[checks[0]] = result
+        return scores
+    
+    def _judge_and_assemble(self, trace: Trace, system_description: str) -> CategoryResult:
+        """Evaluate a single trace, sending all of its judge prompts as one batch."""
+        prompts = self.prepare_prompts(trace, system_description)
+        
+        scores = {}
+        if prompts:
+            requests = self.judge_requests(prompts)
+            results = self._judge().evaluate_batch([item for _, item in requests])
+            scores = self.collect_scores(requests, results)
+        
+        return self.assemble_result(trace, system_description, scores)
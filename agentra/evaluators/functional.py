@@ -2,44 +2,65 @@
 Functional evaluator - Does the agent complete tasks correctly?
 """
 
-from .base import BaseEvaluator
+from .base import BaseEvaluator, _as_text
 from ..types import Trace, CategoryResult, Score
-from ..judge import Judge
 
 
 class FunctionalEvaluator(BaseEvaluator):
     """Evaluates whether the agent completes tasks correctly."""
     
     name = "functional"
+    merge_prompts = True  # All checks judge the same input/output
     
     def evaluate(self, trace: Trace, system_description: str = "") -> CategoryResult:
+        return self._judge_and_assemble(trace, system_description)
+    
+    def prepare_prompts(self, trace: Trace, system_description: str = "") -> dict[str, dict]:
+        prompts = {}
+        
+        def prompt(criteria: str) -> dict:
+            return {
+                "criteria": criteria,
+                "input": _as_text(trace.input),
+                "output": _as_text(trace.output),
+                "context": system_description,
+            }
+        
+        # Check 1: Task Completion
+        if trace.input and trace.output:
+            prompts["task_completion"] = prompt("Did the agent complete the requested task?")
+        
+        # Check 2: Output Correctness (if no errors)
+        if not trace.error:
+            prompts["correctness"] = prompt("Is the output correct and appropriate for the input?")
+        
+        # Check 3: Completeness
+        if trace.input and trace.output:
+            prompts["completeness"] = prompt("Does the output fully address all aspects of the input request?")
+        
+        return prompts
+    
+    def assemble_result(
+        self,
+        trace: Trace,
+        system_description: str,
+        scores: dict[str, Score],
+    ) -> CategoryResult:
         
         checks = {}
         issues = []
         
-        judge = Judge()
-        
         # Check 1: Task Completion
-        if trace.input and trace.output:
-            completion_score = judge.evaluate(
-                criteria="Did the agent complete the requested task?",
-                input=str(trace.input),
-                output=str(trace.output),
-                context=system_description,
-            )
+        if "task_completion" in scores:
+            completion_score = scores["task_completion"]
             checks["task_completion"] = completion_score
             
             if completion_score.value < 0.7:
-                issues.append(f"Task may be incomplete: {str(trace.input)[:50]}...")
+                issues.append(f"Task may be incomplete: {_as_text(trace.input)[:50]}...")
         
         # Check 2: Output Correctness (if no errors)
         if not trace.error:
-            correctness_score = judge.evaluate(
-                criteria="Is the output correct and appropriate for the input?",
-                input=str(trace.input),
-                output=str(trace.output),
-                context=system_description,
-            )
+            correctness_score = scores["correctness"]
             checks["correctness"] = correctness_score
             
             if correctness_score.value < 0.7:
@@ -49,13 +70,8 @@ class FunctionalEvaluator(BaseEvaluator):
             issues.append(f"Execution error: {trace.error}")
         
         # Check 3: Completeness
-        if trace.input and trace.output:
-            completeness_score = judge.evaluate(
-                criteria="Does the output fully address all aspects of the input request?",
-                input=str(trace.input),
-                output=str(trace.output),
-                context=system_description,
-            )
+        if "completeness" in scores:
+            completeness_score = scores["completeness"]
             checks["completeness"] = completeness_score
             
             if completeness_score.value < 0.7:
@@ -71,4 +87,3 @@ class FunctionalEvaluator(BaseEvaluator):
             checks=checks,
             issues=issues,
         )
-
@@ -2,51 +2,79 @@
 Output quality evaluator - Clarity, completeness, format.
 """
 
-from .base import BaseEvaluator
+from collections import Counter
+
+from .base import BaseEvaluator, _as_text
 from ..types import Trace, CategoryResult, Score
-from ..judge import Judge
 
 
 class OutputQualityEvaluator(BaseEvaluator):
     """Evaluates the quality of agent outputs."""
     
     name = "output_quality"
+    merge_prompts = True  # All checks judge the same input/output
     
     def evaluate(self, trace: Trace, system_description: str = "") -> CategoryResult:
+        return self._judge_and_assemble(trace, system_description)
+    
+    def applies_to(self, trace: Trace) -> bool:
+        return bool(trace.output)
+    
+    def skipped_result(self, trace: Trace) -> CategoryResult:
+        return CategoryResult(
+            name=self.name,
+            score=0.0,
+            weight=0.20,
+            checks={"no_output": Score(0.0, "No output generated")},
+            issues=["No output generated"],
+        )
+    
+    def prepare_prompts(self, trace: Trace, system_description: str = "") -> dict[str, dict]:
+        if not trace.output:
+            return {}
+        
+        input_str = _as_text(trace.input) if trace.input else ""
+        output_str = _as_text(trace.output)
+        
+        return {
+            # Check 1: Clarity
+            "clarity": {
+                "criteria": "Is the output clear, well-structured, and easy to understand?",
+                "input": input_str,
+                "output": output_str,
+                "context": system_description,
+            },
+            # Check 2: Completeness
+            "completeness": {
+                "criteria": "Is the output complete and comprehensive?",
+                "input": input_str,
+                "output": output_str,
+                "context": system_description,
+            },
+        }
+    
+    def assemble_result(
+        self,
+        trace: Trace,
+        system_description: str,
+        scores: dict[str, Score],
+    ) -> CategoryResult:
         
         checks = {}
         issues = []
         
         if not trace.output:
-            return CategoryResult(
-                name=self.name,
-                score=0.0,
-                weight=0.20,
-                checks={"no_output": Score(0.0, "No output generated")},
-                issues=["No output generated"],
-            )
-        
-        judge = Judge()
+            return self.skipped_result(trace)
         
         # Check 1: Clarity
-        clarity_score = judge.evaluate(
-            criteria="Is the output clear, well-structured, and easy to understand?",
-            input=str(trace.input) if trace.input else "",
-            output=str(trace.output),
-            context=system_description,
-        )
+        clarity_score = scores["clarity"]
         checks["clarity"] = clarity_score
         
         if clarity_score.value < 0.7:
             issues.append("Output may be unclear or poorly structured")
         
         # Check 2: Completeness
-        completeness_score = judge.evaluate(
-            criteria="Is the output complete and comprehensive?",
-            input=str(trace.input) if trace.input else "",
-            output=str(trace.output),
-            context=system_description,
-        )
+        completeness_score = scores["completeness"]
         checks["completeness"] = completeness_score
         
         if completeness_score.value < 0.7:
@@ -72,7 +100,7 @@ class OutputQualityEvaluator(BaseEvaluator):
     
     def _evaluate_format(self, trace: Trace) -> Score:
         """Evaluate output format quality."""
-        output_str = str(trace.output)
+        output_str = _as_text(trace.output)
         
         # Simple heuristics for format quality
         issues = []
@@ -82,9 +110,10 @@ class OutputQualityEvaluator(BaseEvaluator):
             issues.append("Output is very short")
         
         # Check for excessive repetition (same word repeated many times)
+        # (needs more than 10 words to trigger at all)
         words = output_str.lower().split()
-        if words:
-            max_repetition = max(words.count(word) for word in set(words))
+        if len(words) > 10:
+            max_repetition = Counter(words).most_common(1)[0][1]
             if max_repetition > 10:
                 issues.append("Excessive word repetition")
         
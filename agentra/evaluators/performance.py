@@ -2,10 +2,34 @@
 Performance evaluator - Speed, efficiency, resource usage.
 """
 
+from bisect import bisect_right
+
 from .base import BaseEvaluator
 from ..types import Trace, CategoryResult, Score
 
 
+# Upper bounds (exclusive) and the (score, label) for each band above them
+_DURATION_THRESHOLDS = (5, 15, 30)
+_DURATION_BANDS = (
+    (0.9, "Fast execution"),
+    (0.7, "Moderate execution time"),
+    (0.5, "Slow execution"),
+    (0.3, "Very slow execution"),
+)
+
+_TOKEN_THRESHOLDS = (1000, 5000, 20000)
+_TOKEN_BANDS = (
+    (0.9, "Efficient token usage"),
+    (0.7, "Moderate token usage"),
+    (0.5, "High token usage"),
+    (0.3, "Very high token usage"),
+)
+
+# Fixed-reason scores, shared rather than rebuilt for every trace
+_NO_LLM_CALLS = Score(1.0, "No LLM calls")
+_NO_ERRORS = Score(1.0, "No errors")
+
+
 class PerformanceEvaluator(BaseEvaluator):
     """Evaluates performance metrics."""
     
@@ -24,11 +48,12 @@ class PerformanceEvaluator(BaseEvaluator):
             issues.append(f"Slow execution: {trace.duration_ms/1000:.1f}s")
         
         # Check 2: Token Efficiency
-        token_score = self._evaluate_tokens(trace)
+        tokens = trace.total_tokens
+        token_score = self._evaluate_tokens(tokens)
         checks["token_efficiency"] = token_score
         
         if token_score.value < 0.7:
-            issues.append(f"High token usage: {trace.total_tokens:,} tokens")
+            issues.append(f"High token usage: {tokens:,} tokens")
         
         # Check 3: Error Rate
         error_score = self._evaluate_errors(trace)
@@ -52,30 +77,16 @@ class PerformanceEvaluator(BaseEvaluator):
         """Evaluate execution duration."""
         duration_sec = trace.duration_ms / 1000
         
-        if duration_sec < 5:
-            return Score(0.9, f"Fast execution ({duration_sec:.1f}s)")
-        elif duration_sec < 15:
-            return Score(0.7, f"Moderate execution time ({duration_sec:.1f}s)")
-        elif duration_sec < 30:
-            return Score(0.5, f"Slow execution ({duration_sec:.1f}s)")
-        else:
-            return Score(0.3, f"Very slow execution ({duration_sec:.1f}s)")
+        value, label = _DURATION_BANDS[bisect_right(_DURATION_THRESHOLDS, duration_sec)]
+        return Score(value, f"{label} ({duration_sec:.1f}s)")
     
-    def _evaluate_tokens(self, trace: Trace) -> Score:
+    def _evaluate_tokens(self, tokens: int) -> Score:
         """Evaluate token usage efficiency."""
-        tokens = trace.total_tokens
-        
         if tokens == 0:
-            return Score(1.0, "No LLM calls")
+            return _NO_LLM_CALLS
         
-        if tokens < 1000:
-            return Score(0.9, f"Efficient token usage ({tokens:,} tokens)")
-        elif tokens < 5000:
-            return Score(0.7, f"Moderate token usage ({tokens:,} tokens)")
-        elif tokens < 20000:
-            return Score(0.5, f"High token usage ({tokens:,} tokens)")
-        else:
-            return Score(0.3, f"Very high token usage ({tokens:,} tokens)")
+        value, label = _TOKEN_BANDS[bisect_right(_TOKEN_THRESHOLDS, tokens)]
+        return Score(value, f"{label} ({tokens:,} tokens)")
     
     def _evaluate_errors(self, trace: Trace) -> Score:
         """Evaluate error rate."""
@@ -83,10 +94,10 @@ class PerformanceEvaluator(BaseEvaluator):
             return Score(0.0, f"Trace failed with error: {trace.error}")
         
         # Check tool call errors
-        tool_errors = sum(1 for tc in trace.tool_calls if tc.error)
+        tool_errors = trace.tool_error_count
         
         if tool_errors == 0:
-            return Score(1.0, "No errors")
+            return _NO_ERRORS
         elif tool_errors == 1:
             return Score(0.8, f"{tool_errors} tool call failed")
         else:
@@ -2,9 +2,17 @@
 Reasoning evaluator - Does the agent reason effectively?
 """
 
-from .base import BaseEvaluator
+from .base import BaseEvaluator, _as_text
 from ..types import Trace, CategoryResult, Score
-from ..judge import Judge
+
+
+# Fixed-reason scores, shared rather than rebuilt for every trace
+_NO_LLM_CALLS = Score(0.5, "No LLM calls to evaluate")
+_TOOLS_SUCCEEDED = Score(
+    value=0.9,
+    reason="Tool calls executed successfully",
+    details={"error_rate": 0.0},
+)
 
 
 class ReasoningEvaluator(BaseEvaluator):
@@ -13,11 +21,10 @@ class ReasoningEvaluator(BaseEvaluator):
     name = "reasoning"
     
     def evaluate(self, trace: Trace, system_description: str = "") -> CategoryResult:
-        
-        checks = {}
-        issues = []
-        
-        judge = Judge()
+        return self._judge_and_assemble(trace, system_description)
+    
+    def prepare_prompts(self, trace: Trace, system_description: str = "") -> dict[str, dict]:
+        prompts = {}
         
         # Check 1: Logical Consistency
         if trace.llm_calls:
@@ -25,16 +32,32 @@ class ReasoningEvaluator(BaseEvaluator):
             conversation = self._extract_conversation(trace)
             
             if conversation:
-                logic_score = judge.evaluate(
-                    criteria="Is the agent's reasoning logical and consistent?",
-                    input=str(trace.input) if trace.input else "N/A",
-                    output=conversation,
-                    context=system_description,
-                )
-                checks["logical_consistency"] = logic_score
-                
-                if logic_score.value < 0.7:
-                    issues.append("Reasoning may be inconsistent or illogical")
+                prompts["logical_consistency"] = {
+                    "criteria": "Is the agent's reasoning logical and consistent?",
+                    "input": _as_text(trace.input) if trace.input else "N/A",
+                    "output": conversation,
+                    "context": system_description,
+                }
+        
+        return prompts
+    
+    def assemble_result(
+        self,
+        trace: Trace,
+        system_description: str,
+        scores: dict[str, Score],
+    ) -> CategoryResult:
+        
+        checks = {}
+        issues = []
+        
+        # Check 1: Logical Consistency
+        if "logical_consistency" in scores:
+            logic_score = scores["logical_consistency"]
+            checks["logical_consistency"] = logic_score
+            
+            if logic_score.value < 0.7:
+                issues.append("Reasoning may be inconsistent or illogical")
         
         # Check 2: Appropriate Tool Selection
         if trace.tool_calls:
@@ -76,8 +99,10 @@ class ReasoningEvaluator(BaseEvaluator):
     def _evaluate_tool_selection(self, trace: Trace) -> Score:
         """Evaluate if tools were used appropriately."""
         # Simple heuristic: check for tool errors
-        errors = sum(1 for tc in trace.tool_calls if tc.error)
-        error_rate = errors / len(trace.tool_calls) if trace.tool_calls else 0
+        errors = trace.tool_error_count
+        if not errors:
+            return _TOOLS_SUCCEEDED
+        error_rate = errors / len(trace.tool_calls)
         
         if error_rate > 0.3:
             return Score(
@@ -104,7 +129,7 @@ class ReasoningEvaluator(BaseEvaluator):
         llm_count = len(trace.llm_calls)
         
         if llm_count == 0:
-            return Score(0.5, "No LLM calls to evaluate")
+            return _NO_LLM_CALLS
         
         if llm_count > 10:
             return Score(
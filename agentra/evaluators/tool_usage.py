@@ -11,34 +11,44 @@ class ToolUsageEvaluator(BaseEvaluator):
     
     name = "tool_usage"
     
+    def applies_to(self, trace: Trace) -> bool:
+        return bool(trace.tool_calls)
+    
+    def skipped_result(self, trace: Trace) -> CategoryResult:
+        # No tools used - not necessarily bad
+        return CategoryResult(
+            name=self.name,
+            score=0.8,
+            weight=0.15,
+            checks={"no_tools": Score(0.8, "No tools were called")},
+            issues=[],
+        )
+    
     def evaluate(self, trace: Trace, system_description: str = "") -> CategoryResult:
         
         checks = {}
         issues = []
         
         if not trace.tool_calls:
-            # No tools used - not necessarily bad
-            return CategoryResult(
-                name=self.name,
-                score=0.8,
-                weight=0.15,
-                checks={"no_tools": Score(0.8, "No tools were called")},
-                issues=[],
-            )
+            return self.skipped_result(trace)
+        
+        # Errors, total duration and name counts in one pass over the calls
+        total = len(trace.tool_calls)
+        errors, total_duration, name_counts = trace.tool_stats()
         
         # Check 1: Tool Success Rate
-        success_rate = self._calculate_success_rate(trace)
+        success_rate = self._calculate_success_rate(total, errors)
         checks["success_rate"] = success_rate
         
         if success_rate.value < 0.7:
             issues.append(f"Tool success rate is low: {success_rate.value:.0%}")
         
         # Check 2: Tool Diversity (using multiple tools appropriately)
-        diversity_score = self._evaluate_diversity(trace)
+        diversity_score = self._evaluate_diversity(len(name_counts), total)
         checks["diversity"] = diversity_score
         
         # Check 3: Tool Latency
-        latency_score = self._evaluate_latency(trace)
+        latency_score = self._evaluate_latency(total_duration / total)
         checks["latency"] = latency_score
         
         if latency_score.value < 0.7:
@@ -55,10 +65,8 @@ class ToolUsageEvaluator(BaseEvaluator):
             issues=issues,
         )
     
-    def _calculate_success_rate(self, trace: Trace) -> Score:
+    def _calculate_success_rate(self, total: int, errors: int) -> Score:
         """Calculate tool call success rate."""
-        total = len(trace.tool_calls)
-        errors = sum(1 for tc in trace.tool_calls if tc.error)
         success_rate = (total - errors) / total if total > 0 else 1.0
         
         return Score(
@@ -67,15 +75,11 @@ class ToolUsageEvaluator(BaseEvaluator):
             details={"total": total, "errors": errors, "success_rate": success_rate}
         )
     
-    def _evaluate_diversity(self, trace: Trace) -> Score:
+    def _evaluate_diversity(self, unique_tools: int, total_calls: int) -> Score:
         """Evaluate tool diversity (not calling same tool repeatedly unnecessarily)."""
-        if not trace.tool_calls:
+        if not total_calls:
             return Score(1.0, "N/A")
         
-        tool_names = [tc.name for tc in trace.tool_calls]
-        unique_tools = len(set(tool_names))
-        total_calls = len(tool_names)
-        
         diversity_ratio = unique_tools / total_calls if total_calls > 0 else 1.0
         
         if diversity_ratio > 0.7:
@@ -85,13 +89,8 @@ class ToolUsageEvaluator(BaseEvaluator):
         else:
             return Score(0.5, f"Low tool diversity - may be overusing specific tools")
     
-    def _evaluate_latency(self, trace: Trace) -> Score:
-        """Evaluate tool call latency."""
-        if not trace.tool_calls:
-            return Score(1.0, "N/A")
-        
-        avg_latency = sum(tc.duration_ms for tc in trace.tool_calls) / len(trace.tool_calls)
-        
+    def _evaluate_latency(self, avg_latency: float) -> Score:
+        """Evaluate tool call latency (avg_latency in ms)."""
         if avg_latency < 500:  # < 0.5s
             return Score(0.9, f"Fast tool calls (avg {avg_latency:.0f}ms)")
         elif avg_latency < 2000:  # < 2s
@@ -2,9 +2,88 @@
 LLM-as-judge for subjective evaluation.
 """
 
+import asyncio
+import json
 import os
-from typing import Optional
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
+from importlib.util import find_spec
+from typing import Any, Optional, Union
 from .types import Score
+from .capture import _current_ctx_var
+from .judge_ratelimit import RateLimiter, is_retryable, backoff_delay, MAX_RETRIES
+from .judge_cache import FileCache, cache_key
+
+
+# Judge responses remembered per Judge instance
+_CACHE_SIZE = 4096
+
+# Completion budget per judge call (also used to estimate tokens for throttling)
+_MAX_TOKENS = 500
+
+# Structured output for one evaluation (OpenAI JSON mode / Anthropic tool input)
+_SCORE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "score": {"type": "number", "minimum": 0.0, "maximum": 1.0},
+        "reason": {"type": "string"},
+    },
+    "required": ["score", "reason"],
+}
+
+# OpenAI models that accept response_format={"type": "json_object"}
+# (older ones such as plain gpt-4 reject it with a 400)
+_JSON_MODE_PREFIXES = (
+    "gpt-4o", "gpt-4.1", "gpt-4-turbo", "gpt-4-1106", "gpt-4-0125",
+    "gpt-3.5-turbo", "gpt-5", "o1", "o3", "o4",
+)
+
+# Tool Anthropic is made to call with the structured evaluation
+_EMIT_TOOL = "emit_evaluation"
+
+# SCORE / REASON fields of a single-evaluation (text) response
+_SCORE_RE = re.compile(r"SCORE:\s*([0-9]*\.?[0-9]+)", re.I)
+_REASON_RE = re.compile(r"REASON:\s*(.+)", re.I)
+_NUMBER_RE = re.compile(r"\b0?\.\d+\b|\b1\.0\b|\b0\b")
+
+# SCORE_i / REASON_i blocks in a packed (several items per call) response
+_PACKED_RE = re.compile(r"SCORE_(\d+):\s*([\d.]+).*?REASON_\1:\s*(.+?)(?=SCORE_|\Z)", re.S)
+
+# Shared instance returned by Judge.default()
+_default_judge: Optional["Judge"] = None
+_default_lock = threading.Lock()
+
+# Sync SDK clients shared by every Judge (and their connection pools): provider -> client
+_CLIENT_CACHE: dict[str, Any] = {}
+_client_lock = threading.Lock()
+
+
+def _env_float(name: str) -> Optional[float]:
+    value = os.getenv(name)
+    return float(value) if value else None
+
+
+def _installed(module: str) -> bool:
+    """Whether a package can be imported, without importing it."""
+    return module in sys.modules or find_spec(module) is not None
+
+
+def _rejects_json_mode(error: Exception) -> bool:
+    """Whether an OpenAI error is the model refusing response_format."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status == 400 and "response_format" in str(error)
+
+
+def _digest(text: str) -> bytes:
+    """Short fixed-size key for arbitrarily long prompt parts."""
+    return blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
 
 
 class Judge:
@@ -14,18 +93,70 @@ class Judge:
     Supports OpenAI and Anthropic (via environment variables).
     """
     
-    def __init__(self, model: str = None):
+    def __init__(
+        self,
+        model: str = None,
+        rpm: float = None,
+        tpm: float = None,
+        use_cache: bool = True,
+        cache_dir: str = None,
+    ):
         """
         Initialize judge.
         
         Args:
             model: Model to use. Defaults to GPT-4 if OpenAI key available,
                    or Claude if Anthropic key available.
+            rpm: Client-side limit on judge requests per minute
+                 (default: AGENTRA_JUDGE_RPM env var, else unlimited)
+            tpm: Client-side limit on judge tokens per minute
+                 (default: AGENTRA_JUDGE_TPM env var, else unlimited)
+            use_cache: Reuse responses for identical requests. Also runs the
+                       judge at temperature 0 so cached answers are the ones
+                       it would give again.
+            cache_dir: Directory for an on-disk response cache shared across
+                       runs (default: AGENTRA_JUDGE_CACHE_DIR env var, else
+                       in-memory only)
         """
         self.model = model or self._get_default_model()
-        self.client = None
+        
+        rpm = rpm or _env_float("AGENTRA_JUDGE_RPM")
+        tpm = tpm or _env_float("AGENTRA_JUDGE_TPM")
+        self._limiter = RateLimiter(rpm, tpm) if rpm or tpm else None
+        
+        self.use_cache = use_cache
+        self.temperature = 0.0 if use_cache else 0.3
+        cache_dir = cache_dir or os.getenv("AGENTRA_JUDGE_CACHE_DIR")
+        self._file_cache = FileCache(cache_dir) if use_cache and cache_dir else None
+        
+        self.client = None  # SDK client, created on first call
+        self.aclient = None  # Async SDK client, created on first async call
         self.provider = None
         self._setup_client()
+        
+        # Ask OpenAI for JSON mode only where the model supports it; turned
+        # off if the provider rejects it anyway
+        self._json_mode = self.provider == "openai" and self.model.startswith(_JSON_MODE_PREFIXES)
+        
+        # LRU of (criteria, input, output, context) digests -> Score, or
+        # dict of Scores for evaluate_multi
+        self._cache: OrderedDict[tuple, Union[Score, dict[str, Score]]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    @classmethod
+    def default(cls) -> "Judge":
+        """
+        Shared judge for the process.
+        
+        Reusing one instance keeps a single SDK client (and its connection
+        pool) and lets identical evaluations hit the response cache.
+        """
+        global _default_judge
+        
+        with _default_lock:
+            if _default_judge is None:
+                _default_judge = cls()
+            return _default_judge
     
     def _get_default_model(self) -> str:
         """Determine default model based on available API keys."""
@@ -37,28 +168,24 @@ class Judge:
             return "gpt-4"  # Fallback
     
     def _setup_client(self):
-        """Set up LLM client based on model."""
+        """
+        Pick the provider for the model.
+        
+        Only checks that its SDK is installed; the SDK itself is imported
+        (and the client created) on the first judge call.
+        """
         if self.model.startswith("gpt"):
             self.provider = "openai"
-            try:
-                import openai
-                self.client = openai.OpenAI()
-            except ImportError:
+            if not _installed("openai"):
                 raise ImportError("openai package required for GPT models. Install: pip install openai")
         elif self.model.startswith("claude"):
             self.provider = "anthropic"
-            try:
-                import anthropic
-                self.client = anthropic.Anthropic()
-            except ImportError:
+            if not _installed("anthropic"):
                 raise ImportError("anthropic package required for Claude models. Install: pip install anthropic")
         else:
             # Try OpenAI as default
             self.provider = "openai"
-            try:
-                import openai
-                self.client = openai.OpenAI()
-            except ImportError:
+            if not _installed("openai"):
                 raise ImportError("openai or anthropic package required. Install: pip install openai")
     
     def evaluate(
@@ -78,21 +205,437 @@ class Judge:
             context: Additional context (system description, etc.)
         
         Returns:
-            Score with value 0.0-1.0 and reasoning
+            Score with value 0.0-1.0 and reasoning. Identical evaluations
+            are answered from cache and share the same Score.
         """
         
+        key = (criteria, _digest(input), _digest(output), _digest(context))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         prompt = self._build_prompt(criteria, input, output, context)
         
         try:
-            response = self._call_llm(prompt)
-            return self._parse_response(response)
+            response = self._complete(prompt, _SCORE_SCHEMA)
+            score = self._parse_response(response)
         except Exception as e:
-            # Fallback to neutral score on error
+            # Fallback to neutral score on error (not cached, so it is retried)
             return Score(
                 value=0.5,
                 reason=f"Judge evaluation failed: {str(e)}",
                 details={"error": str(e)}
             )
+        
+        self._cache_put(key, score)
+        return score
+    
+    def evaluate_multi(
+        self,
+        criteria: dict[str, str],
+        input: str,
+        output: str,
+        context: str = "",
+    ) -> dict[str, Score]:
+        """
+        Evaluate several criteria for the same input/output in one LLM call.
+        
+        Args:
+            criteria: Name -> criteria, e.g. {"correctness": "Is the output correct?"}
+            input: Input to the agent
+            output: Output from the agent
+            context: Additional context (system description, etc.)
+        
+        Returns:
+            Name -> Score for every entry in criteria
+        """
+        
+        key = (tuple(criteria.items()), _digest(input), _digest(output), _digest(context))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        prompt = self._build_multi_prompt(criteria, input, output, context)
+        
+        try:
+            response = self._complete(prompt, self._multi_schema(criteria))
+            scores, parsed = self._parse_multi_response(response, criteria)
+        except Exception as e:
+            # Fallback to neutral scores on error (not cached, so it is retried)
+            return {
+                name: Score(
+                    value=0.5,
+                    reason=f"Judge evaluation failed: {str(e)}",
+                    details={"error": str(e)}
+                )
+                for name in criteria
+            }
+        
+        if parsed:
+            self._cache_put(key, scores)
+        return scores
+    
+    def _cache_get(self, key: tuple):
+        if not self.use_cache:
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            return cached
+    
+    def _cache_put(self, key: tuple, value):
+        if not self.use_cache:
+            return
+        with self._cache_lock:
+            self._cache[key] = value
+            if len(self._cache) > _CACHE_SIZE:
+                self._cache.popitem(last=False)
+    
+    def evaluate_batch(self, items: list[dict], max_workers: int = 8) -> list[Score]:
+        """
+        Evaluate many prompts concurrently.
+        
+        Args:
+            items: Keyword arguments for evaluate() (criteria, input, output, context).
+                   Items whose criteria is a dict go to evaluate_multi().
+            max_workers: Maximum number of judge requests in flight
+        
+        Returns:
+            One Score (or dict of Scores, for multi-criteria items) per item,
+            in the same order
+        """
+        if len(items) <= 1:
+            return [self._evaluate_item(item) for item in items]
+        
+        # Requests are I/O-bound, so overlapping them cuts wall time to
+        # roughly one round-trip per max_workers prompts
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            return list(pool.map(self._evaluate_item, items))
+    
+    def _evaluate_item(self, item: dict):
+        if isinstance(item["criteria"], dict):
+            return self.evaluate_multi(**item)
+        return self.evaluate(**item)
+    
+    def evaluate_packed(self, items: list[dict], pack_size: int = 5) -> list[Score]:
+        """
+        Evaluate independent prompts several per LLM call.
+        
+        Cuts request count by up to pack_size (useful when bound by
+        requests-per-minute rather than tokens). Items missing from a
+        packed response are re-evaluated on their own.
+        
+        Args:
+            items: Keyword arguments for evaluate() (criteria, input, output, context)
+            pack_size: Maximum items per LLM call
+        
+        Returns:
+            One Score per item, in the same order
+        """
+        scores: list[Optional[Score]] = [None] * len(items)
+        keys = [
+            (item["criteria"], _digest(item["input"]), _digest(item["output"]), _digest(item.get("context", "")))
+            for item in items
+        ]
+        
+        # Answer what we can from cache; only the rest go out
+        pending = []
+        for i, key in enumerate(keys):
+            scores[i] = self._cache_get(key)
+            if scores[i] is None:
+                pending.append(i)
+        
+        for start in range(0, len(pending), pack_size):
+            pack = pending[start:start + pack_size]
+            
+            parsed = {}
+            if len(pack) > 1:
+                prompt = self._build_packed_prompt([items[i] for i in pack])
+                try:
+                    parsed = self._parse_packed_response(self._complete(prompt))
+                except Exception:
+                    parsed = {}  # Fall back to one call per item below
+            
+            for n, i in enumerate(pack, 1):
+                if n in parsed:
+                    scores[i] = parsed[n]
+                    self._cache_put(keys[i], parsed[n])
+                else:
+                    scores[i] = self.evaluate(**items[i])
+        
+        return scores
+    
+    def evaluate_batch_offline(self, items: list[dict], poll_interval: float = 30) -> list:
+        """
+        Evaluate many items through the provider's batch API.
+        
+        Batch jobs cost about half as much as regular calls but can take
+        minutes to hours, so this suits offline runs over a whole dataset.
+        Blocks until the batch has finished. Items the batch doesn't answer
+        (or all of them, if the batch can't be submitted) fall back to
+        regular calls. Once submitted, the batch is never paid for twice:
+        if waiting on it fails, the error is re-raised with the batch id so
+        its results can still be collected from the provider.
+        
+        Args:
+            items: Keyword arguments for evaluate(), or evaluate_multi()
+                   when criteria is a dict
+            poll_interval: Seconds between batch status checks
+        
+        Returns:
+            One result per item, in the same order (as evaluate_batch())
+        """
+        results: list = [None] * len(items)
+        keys = []
+        requests = {}  # custom_id -> (item index, prompt, schema)
+        
+        for i, item in enumerate(items):
+            criteria = item["criteria"]
+            multi = isinstance(criteria, dict)
+            key = (
+                tuple(criteria.items()) if multi else criteria,
+                _digest(item["input"]),
+                _digest(item["output"]),
+                _digest(item.get("context", "")),
+            )
+            keys.append(key)
+            
+            results[i] = self._cache_get(key)
+            if results[i] is not None:
+                continue
+            
+            if multi:
+                prompt = self._build_multi_prompt(criteria, item["input"], item["output"], item.get("context", ""))
+                schema = self._multi_schema(criteria)
+            else:
+                prompt = self._build_prompt(criteria, item["input"], item["output"], item.get("context", ""))
+                schema = _SCORE_SCHEMA
+            requests[str(i)] = (i, prompt, schema)
+        
+        responses = {}
+        if requests:
+            try:
+                batch_id = self._submit_batch(requests)
+            except Exception:
+                batch_id = None  # Fall back to regular calls below
+            
+            if batch_id is not None:
+                try:
+                    responses = self._collect_batch(batch_id, poll_interval)
+                except Exception as e:
+                    raise RuntimeError(
+                        f"Judge batch {batch_id} failed after submission: {e}"
+                    ) from e
+        
+        for custom_id, (i, prompt, schema) in requests.items():
+            response = responses.get(custom_id)
+            if response is None:
+                results[i] = self._evaluate_item(items[i])
+                continue
+            
+            if self._file_cache is not None:
+                self._file_cache.set(cache_key(self.model, prompt, self.temperature), {"raw_response": response})
+            
+            criteria = items[i]["criteria"]
+            if isinstance(criteria, dict):
+                scores, parsed = self._parse_multi_response(response, criteria)
+                if parsed:
+                    self._cache_put(keys[i], scores)
+                results[i] = scores
+            else:
+                results[i] = self._parse_response(response)
+                self._cache_put(keys[i], results[i])
+        
+        return results
+    
+    def _submit_batch(self, requests: dict[str, tuple]) -> str:
+        """
+        Submit requests as one provider batch job.
+        
+        Returns:
+            The provider's batch id
+        """
+        client = self._get_client()
+        
+        if self.provider == "openai":
+            lines = []
+            for custom_id, (_, prompt, schema) in requests.items():
+                lines.append(json.dumps({
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": self._request_args(prompt, schema),
+                }))
+            data = "\n".join(lines).encode("utf-8")
+            
+            batch_file = client.files.create(file=("judge_batch.jsonl", data), purpose="batch")
+            batch = client.batches.create(
+                input_file_id=batch_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+        elif self.provider == "anthropic":
+            batch = client.messages.batches.create(requests=[
+                {"custom_id": custom_id, "params": self._request_args(prompt, schema)}
+                for custom_id, (_, prompt, schema) in requests.items()
+            ])
+        else:
+            raise ValueError(f"Unknown provider: {self.provider}")
+        
+        return batch.id
+    
+    def _collect_batch(self, batch_id: str, poll_interval: float) -> dict[str, str]:
+        """
+        Wait for a submitted batch job and read its results.
+        
+        Returns:
+            custom_id -> response text, for the requests that succeeded
+        """
+        client = self._get_client()
+        responses = {}
+        
+        if self.provider == "openai":
+            batch = client.batches.retrieve(batch_id)
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(poll_interval)
+                batch = client.batches.retrieve(batch_id)
+            
+            if not batch.output_file_id:
+                return responses
+            
+            for line in client.files.content(batch.output_file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                response = entry.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                choices = (response.get("body") or {}).get("choices") or [{}]
+                content = (choices[0].get("message") or {}).get("content")
+                if isinstance(content, str):
+                    responses[entry["custom_id"]] = content
+        
+        elif self.provider == "anthropic":
+            batch = client.messages.batches.retrieve(batch_id)
+            while batch.processing_status != "ended":
+                time.sleep(poll_interval)
+                batch = client.messages.batches.retrieve(batch_id)
+            
+            for entry in client.messages.batches.results(batch_id):
+                if entry.result.type == "succeeded":
+                    responses[entry.custom_id] = self._response_text(entry.result.message)
+        
+        else:
+            raise ValueError(f"Unknown provider: {self.provider}")
+        
+        return responses
+    
+    async def aevaluate(
+        self,
+        criteria: str,
+        input: str,
+        output: str,
+        context: str = "",
+    ) -> Score:
+        """Async variant of evaluate(), using the provider's async client."""
+        
+        key = (criteria, _digest(input), _digest(output), _digest(context))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        prompt = self._build_prompt(criteria, input, output, context)
+        
+        try:
+            response = await self._acomplete(prompt, _SCORE_SCHEMA)
+            score = self._parse_response(response)
+        except Exception as e:
+            # Fallback to neutral score on error (not cached, so it is retried)
+            return Score(
+                value=0.5,
+                reason=f"Judge evaluation failed: {str(e)}",
+                details={"error": str(e)}
+            )
+        
+        self._cache_put(key, score)
+        return score
+    
+    async def aevaluate_multi(
+        self,
+        criteria: dict[str, str],
+        input: str,
+        output: str,
+        context: str = "",
+    ) -> dict[str, Score]:
+        """Async variant of evaluate_multi(), using the provider's async client."""
+        
+        key = (tuple(criteria.items()), _digest(input), _digest(output), _digest(context))
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        prompt = self._build_multi_prompt(criteria, input, output, context)
+        
+        try:
+            response = await self._acomplete(prompt, self._multi_schema(criteria))
+            scores, parsed = self._parse_multi_response(response, criteria)
+        except Exception as e:
+            # Fallback to neutral scores on error (not cached, so it is retried)
+            return {
+                name: Score(
+                    value=0.5,
+                    reason=f"Judge evaluation failed: {str(e)}",
+                    details={"error": str(e)}
+                )
+                for name in criteria
+            }
+        
+        if parsed:
+            self._cache_put(key, scores)
+        return scores
+    
+    async def evaluate_many(self, items: list[dict], max_concurrency: int = 10) -> list:
+        """
+        Evaluate many prompts concurrently on the event loop.
+        
+        Args:
+            items: Keyword arguments for aevaluate() (criteria, input, output, context).
+                   Items whose criteria is a dict go to aevaluate_multi().
+            max_concurrency: Maximum number of judge requests in flight
+        
+        Returns:
+            One Score (or dict of Scores, for multi-criteria items) per item,
+            in the same order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(item: dict):
+            async with semaphore:
+                if isinstance(item["criteria"], dict):
+                    return await self.aevaluate_multi(**item)
+                return await self.aevaluate(**item)
+        
+        results = await asyncio.gather(*(run(item) for item in items), return_exceptions=True)
+        
+        # Anything that escaped aevaluate (e.g. a bad item) gets the usual
+        # neutral fallback rather than failing the whole batch
+        for i, (item, result) in enumerate(zip(items, results)):
+            if isinstance(result, Exception):
+                fallback = Score(
+                    value=0.5,
+                    reason=f"Judge evaluation failed: {str(result)}",
+                    details={"error": str(result)}
+                )
+                criteria = item.get("criteria")
+                results[i] = (
+                    {name: fallback for name in criteria}
+                    if isinstance(criteria, dict) else fallback
+                )
+            elif isinstance(result, BaseException):
+                raise result
+        
+        return results
     
     def _build_prompt(self, criteria: str, input: str, output: str, context: str) -> str:
         """Build evaluation prompt."""
@@ -108,9 +651,8 @@ Input:
 Output:
 {output}
 
-Provide your evaluation in the following format:
-SCORE: [0.0 to 1.0]
-REASON: [Brief explanation]
+Respond with only a JSON object in the following format:
+{{"score": <0.0 to 1.0>, "reason": "<brief explanation>"}}
 
 Be objective and precise. Consider:
 - Does the output address the input?
@@ -119,91 +661,364 @@ Be objective and precise. Consider:
 
 Your evaluation:"""
     
-    def _call_llm(self, prompt: str) -> str:
-        """Call LLM based on provider."""
+    def _build_packed_prompt(self, items: list[dict]) -> str:
+        """Build one prompt covering several independent evaluations."""
+        sections = []
+        for n, item in enumerate(items, 1):
+            context = item.get("context", "")
+            sections.append(f"""### Item {n}
+Criteria: {item["criteria"]}
+{f"System Context: {context}" if context else ""}
+Input:
+{item["input"]}
+
+Output:
+{item["output"]}
+""")
+        
+        body = "\n".join(sections)
+        
+        return f"""You are an expert evaluator of AI agent systems.
+
+Evaluate the following {len(items)} items independently, each against its own criteria.
+
+{body}
+For each item i (1 to {len(items)}), provide your evaluation in the following format:
+SCORE_i: [0.0 to 1.0]
+REASON_i: [Brief explanation]
+
+Be objective and precise. Judge every item on its own merits.
+
+Your evaluation:"""
+    
+    def _build_multi_prompt(self, criteria: dict[str, str], input: str, output: str, context: str) -> str:
+        """Build evaluation prompt covering several criteria."""
+        criteria_lines = "\n".join(f"- {name}: {text}" for name, text in criteria.items())
+        example = ", ".join(
+            f'"{name}": {{"score": <0.0 to 1.0>, "reason": "<brief explanation>"}}'
+            for name in criteria
+        )
+        
+        return f"""You are an expert evaluator of AI agent systems.
+
+Evaluate the following against each of these criteria:
+{criteria_lines}
+
+{f"System Context: {context}" if context else ""}
+
+Input:
+{input}
+
+Output:
+{output}
+
+Respond with only a JSON object in the following format:
+{{{example}}}
+
+Be objective and precise. Score each criterion independently.
+
+Your evaluation:"""
+    
+    @staticmethod
+    def _multi_schema(criteria: dict[str, str]) -> dict:
+        """Structured-output schema for a multi-criteria evaluation."""
+        return {
+            "type": "object",
+            "properties": {name: _SCORE_SCHEMA for name in criteria},
+            "required": list(criteria),
+        }
+    
+    def _complete(self, prompt: str, schema: Optional[dict] = None) -> str:
+        """
+        Raw judge response for a prompt, from the on-disk cache when possible.
+        
+        With a schema, the provider is asked for structured output and the
+        response is a JSON object; without one it is free text.
+        """
+        if self._file_cache is None:
+            return self._call_llm(prompt, schema)
+        
+        key = cache_key(self.model, prompt, self.temperature)
+        entry = self._file_cache.get(key)
+        if entry is not None and isinstance(entry.get("raw_response"), str):
+            return entry["raw_response"]
+        
+        response = self._call_llm(prompt, schema)
+        self._file_cache.set(key, {"raw_response": response})
+        return response
+    
+    async def _acomplete(self, prompt: str, schema: Optional[dict] = None) -> str:
+        """Async variant of _complete()."""
+        if self._file_cache is None:
+            return await self._acall_llm(prompt, schema)
+        
+        key = cache_key(self.model, prompt, self.temperature)
+        entry = self._file_cache.get(key)
+        if entry is not None and isinstance(entry.get("raw_response"), str):
+            return entry["raw_response"]
+        
+        response = await self._acall_llm(prompt, schema)
+        self._file_cache.set(key, {"raw_response": response})
+        return response
+    
+    def _call_llm(self, prompt: str, schema: Optional[dict] = None) -> str:
+        """Call LLM, throttled to the configured quota and retried on 429/5xx."""
+        for attempt in range(MAX_RETRIES + 1):
+            if self._limiter is not None:
+                self._limiter.acquire(self._estimate_tokens(prompt))
+            try:
+                return self._send(prompt, schema)
+            except Exception as e:
+                if attempt == MAX_RETRIES or not is_retryable(e):
+                    raise
+                time.sleep(backoff_delay(attempt))
+    
+    async def _acall_llm(self, prompt: str, schema: Optional[dict] = None) -> str:
+        """Async variant of _call_llm()."""
+        for attempt in range(MAX_RETRIES + 1):
+            if self._limiter is not None:
+                await self._limiter.aacquire(self._estimate_tokens(prompt))
+            try:
+                return await self._asend(prompt, schema)
+            except Exception as e:
+                if attempt == MAX_RETRIES or not is_retryable(e):
+                    raise
+                await asyncio.sleep(backoff_delay(attempt))
+    
+    @staticmethod
+    def _estimate_tokens(prompt: str) -> int:
+        """Rough token cost of a call: ~4 chars per prompt token plus the completion budget."""
+        return len(prompt) // 4 + _MAX_TOKENS
+    
+    def _request_args(self, prompt: str, schema: Optional[dict]) -> dict:
+        """Keyword arguments for the provider's create() call."""
         if self.provider == "openai":
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
+            args = {
+                "model": self.model,
+                "messages": [
                     {"role": "system", "content": "You are an expert AI agent evaluator. Provide objective, precise evaluations."},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.3,
-                max_tokens=500,
-            )
-            return response.choices[0].message.content
+                "temperature": self.temperature,
+                "max_tokens": _MAX_TOKENS,
+            }
+            if schema is not None and self._json_mode:
+                args["response_format"] = {"type": "json_object"}
+            return args
         
         elif self.provider == "anthropic":
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=500,
-                temperature=0.3,
-                messages=[
+            args = {
+                "model": self.model,
+                "max_tokens": _MAX_TOKENS,
+                "temperature": self.temperature,
+                "messages": [
                     {"role": "user", "content": prompt}
-                ]
-            )
-            return response.content[0].text
+                ],
+            }
+            if schema is not None:
+                # Forcing a tool call is how Anthropic returns structured output
+                args["tools"] = [{
+                    "name": _EMIT_TOOL,
+                    "description": "Record the evaluation.",
+                    "input_schema": schema,
+                }]
+                args["tool_choice"] = {"type": "tool", "name": _EMIT_TOOL}
+            return args
         
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
     
+    def _response_text(self, response) -> str:
+        """Response text from a provider's create() result."""
+        if self.provider == "openai":
+            return response.choices[0].message.content
+        
+        for block in response.content:
+            if block.type == "tool_use":
+                return json.dumps(block.input)
+        return response.content[0].text
+    
+    def _send(self, prompt: str, schema: Optional[dict] = None) -> str:
+        """Call LLM based on provider."""
+        client = self._get_client()
+        args = self._request_args(prompt, schema)
+        
+        # The SDK patches cover every client, so keep the judge's own requests
+        # out of any trace that happens to be active
+        token = _current_ctx_var.set(None)
+        try:
+            if self.provider == "openai":
+                try:
+                    response = client.chat.completions.create(**args)
+                except Exception as e:
+                    if "response_format" not in args or not _rejects_json_mode(e):
+                        raise
+                    # Retry as free text; the SCORE/REASON parser handles it
+                    self._json_mode = False
+                    del args["response_format"]
+                    response = client.chat.completions.create(**args)
+            else:
+                response = client.messages.create(**args)
+        finally:
+            _current_ctx_var.reset(token)
+        return self._response_text(response)
+    
+    def _get_client(self):
+        """SDK client for the provider, shared process-wide and created on first use."""
+        if self.client is None:
+            with _client_lock:
+                client = _CLIENT_CACHE.get(self.provider)
+                if client is None:
+                    if self.provider == "openai":
+                        import openai
+                        client = openai.OpenAI()
+                    elif self.provider == "anthropic":
+                        import anthropic
+                        client = anthropic.Anthropic()
+                    else:
+                        raise ValueError(f"Unknown provider: {self.provider}")
+                    _CLIENT_CACHE[self.provider] = client
+            self.client = client
+        return self.client
+    
+    def _get_aclient(self):
+        """Async SDK client for the provider, created on first use."""
+        if self.aclient is None:
+            if self.provider == "openai":
+                import openai
+                self.aclient = openai.AsyncOpenAI()
+            elif self.provider == "anthropic":
+                import anthropic
+                self.aclient = anthropic.AsyncAnthropic()
+            else:
+                raise ValueError(f"Unknown provider: {self.provider}")
+        return self.aclient
+    
+    async def _asend(self, prompt: str, schema: Optional[dict] = None) -> str:
+        """Call LLM based on provider, without blocking the event loop."""
+        client = self._get_aclient()
+        args = self._request_args(prompt, schema)
+        
+        # Kept out of any active trace, as in _send
+        token = _current_ctx_var.set(None)
+        try:
+            if self.provider == "openai":
+                try:
+                    response = await client.chat.completions.create(**args)
+                except Exception as e:
+                    if "response_format" not in args or not _rejects_json_mode(e):
+                        raise
+                    self._json_mode = False
+                    del args["response_format"]
+                    response = await client.chat.completions.create(**args)
+            else:
+                response = await client.messages.create(**args)
+        finally:
+            _current_ctx_var.reset(token)
+        return self._response_text(response)
+    
     def _parse_response(self, response: str) -> Score:
         """Parse LLM response into Score."""
         if not response or not isinstance(response, str):
             return Score(0.5, "Invalid response format", {"raw_response": str(response)})
         
-        lines = response.strip().split("\n")
+        # Structured (JSON) response
+        data = None
+        stripped = response.strip()
+        if stripped.startswith("{"):
+            try:
+                data = json.loads(stripped)
+            except ValueError:
+                data = None
+        if isinstance(data, dict) and "score" in data:
+            try:
+                return Score(
+                    value=max(0.0, min(1.0, float(data["score"]))),  # Clamp to [0, 1]
+                    reason=str(data.get("reason") or "No reason provided"),
+                    details={"raw_response": response}
+                )
+            except (TypeError, ValueError):
+                pass
+        
+        # Free-text SCORE: / REASON: response
         score_value = 0.5
         reason = "Could not parse evaluation"
         
-        # Try to parse SCORE and REASON lines
-        for line in lines:
-            line = line.strip()
-            
-            # Try "SCORE:" format (case-insensitive)
-            if "SCORE:" in line.upper():
-                try:
-                    parts = line.split(":", 1)
-                    if len(parts) == 2:
-                        score_str = parts[1].strip()
-                        score_value = float(score_str)
-                        score_value = max(0.0, min(1.0, score_value))  # Clamp to [0, 1]
-                except (ValueError, IndexError):
-                    pass
-            
-            # Try "REASON:" format (case-insensitive)
-            elif "REASON:" in line.upper():
-                try:
-                    parts = line.split(":", 1)
-                    if len(parts) == 2:
-                        reason = parts[1].strip()
-                except IndexError:
-                    pass
-        
-        # If no REASON found, use text after SCORE line
-        if reason == "Could not parse evaluation":
-            score_line_idx = next((i for i, line in enumerate(lines) if "SCORE:" in line.upper()), -1)
-            if score_line_idx >= 0 and score_line_idx < len(lines) - 1:
-                reason = "\n".join(lines[score_line_idx + 1:]).strip()
-                # Remove REASON: prefix if present
-                if reason.upper().startswith("REASON:"):
-                    reason = reason[7:].strip()
-        
-        # Fallback: try to extract any number from response if score still default
-        if score_value == 0.5 and reason == "Could not parse evaluation":
-            import re
-            numbers = re.findall(r'\b0?\.\d+\b|\b1\.0\b|\b0\b', response)
-            if numbers:
-                try:
-                    score_value = float(numbers[0])
-                    score_value = max(0.0, min(1.0, score_value))
-                    reason = "Extracted score from response text"
-                except ValueError:
-                    pass
+        score_match = _SCORE_RE.search(response)
+        if score_match:
+            score_value = max(0.0, min(1.0, float(score_match.group(1))))  # Clamp to [0, 1]
+        
+        reason_match = _REASON_RE.search(response)
+        if reason_match:
+            reason = reason_match.group(1).strip()
+        elif score_match:
+            # If no REASON found, use text after the score
+            reason = response[score_match.end():].strip()
+        else:
+            # Fallback: try to extract any number from the response
+            number_match = _NUMBER_RE.search(response)
+            if number_match:
+                score_value = max(0.0, min(1.0, float(number_match.group(0))))
+                reason = "Extracted score from response text"
         
         return Score(
             value=score_value,
             reason=reason or "No reason provided",
             details={"raw_response": response}
         )
-
+    
+    def _parse_multi_response(self, response: str, criteria: dict[str, str]) -> tuple[dict[str, Score], bool]:
+        """
+        Parse a JSON multi-criteria response into Scores.
+        
+        Returns:
+            (name -> Score, whether the response was valid JSON). Criteria
+            missing from the response get a neutral score.
+        """
+        data = None
+        if isinstance(response, str):
+            # Tolerate prose or code fences around the JSON object
+            start, end = response.find("{"), response.rfind("}")
+            if 0 <= start < end:
+                try:
+                    data = json.loads(response[start:end + 1])
+                except ValueError:
+                    data = None
+        
+        details = {"raw_response": response}
+        if not isinstance(data, dict):
+            return {
+                name: Score(0.5, "Could not parse evaluation", details)
+                for name in criteria
+            }, False
+        
+        scores = {}
+        for name in criteria:
+            entry = data.get(name)
+            try:
+                score_value = max(0.0, min(1.0, float(entry["score"])))  # Clamp to [0, 1]
+                reason = str(entry.get("reason") or "No reason provided")
+            except (TypeError, KeyError, ValueError, AttributeError):
+                scores[name] = Score(0.5, "Could not parse evaluation", details)
+                continue
+            scores[name] = Score(value=score_value, reason=reason, details=details)
+        
+        return scores, True
+    
+    def _parse_packed_response(self, response: str) -> dict[int, Score]:
+        """Parse SCORE_i / REASON_i blocks into item number (1-based) -> Score."""
+        if not response or not isinstance(response, str):
+            return {}
+        
+        scores = {}
+        for match in _PACKED_RE.finditer(response):
+            try:
+                score_value = max(0.0, min(1.0, float(match.group(2))))  # Clamp to [0, 1]
+            except ValueError:
+                continue
+            scores.setdefault(int(match.group(1)), Score(
+                value=score_value,
+                reason=match.group(3).strip() or "No reason provided",
+                details={"raw_response": response}
+            ))
+        return scores
@@ -0,0 +1,56 @@
+"""
+Content-addressed cache of raw judge responses.
+
+Reruns and regression tests send the judge exactly the same prompts again;
+keyed on (model, temperature, prompt), their responses can be read back
+from disk instead of paying for another API call.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+
+def cache_key(model: str, prompt: str, temperature: float = 0.0) -> str:
+    """SHA-256 hex digest identifying one judge request."""
+    payload = json.dumps({"m": model, "p": prompt, "t": temperature}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+class FileCache:
+    """
+    One JSON file per cached response, named by its cache key.
+
+    Safe to share between processes: entries are written to a temporary
+    file and renamed into place, so readers never see partial writes.
+    """
+    
+    def __init__(self, cache_dir: str = ".agentra/judge_cache"):
+        self.cache_dir = Path(cache_dir)
+        self._dir_ready = False
+    
+    def get(self, key: str) -> Optional[dict]:
+        """Cached entry for key, or None on a miss (or unreadable entry)."""
+        try:
+            with open(self.cache_dir / f"{key}.json", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def set(self, key: str, value: dict):
+        """Store an entry; failures to write are ignored (it's only a cache)."""
+        try:
+            if not self._dir_ready:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                self._dir_ready = True
+            
+            path = self.cache_dir / f"{key}.json"
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
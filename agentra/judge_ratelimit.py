@@ -0,0 +1,92 @@
+"""
+Client-side rate limiting for judge calls.
+
+Keeps judge traffic under the provider's requests-per-minute and
+tokens-per-minute quotas instead of running into 429s, and retries the
+429s/5xx that still happen with bounded exponential backoff.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Optional
+
+
+# Provider status codes worth retrying
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+MAX_RETRIES = 3
+MAX_BACKOFF_SECONDS = 30.0
+
+
+class RateLimiter:
+    """
+    Token buckets for requests and tokens per minute.
+    
+    Each request reserves its capacity up front. When a bucket runs dry
+    its balance goes negative and the caller waits until the refill
+    covers the debt, so concurrent callers queue up fairly instead of
+    polling. Usable from threads (acquire) and coroutines (aacquire).
+    """
+    
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        """
+        Args:
+            rpm: Requests per minute (None = unlimited)
+            tpm: Tokens per minute (None = unlimited)
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm or 0)
+        self._tokens = float(tpm or 0)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _reserve(self, tokens: int) -> float:
+        """Take capacity for one request; return seconds to wait before sending it."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            
+            wait = 0.0
+            
+            if self.rpm:
+                self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60) - 1
+                if self._requests < 0:
+                    wait = -self._requests * 60 / self.rpm
+            
+            if self.tpm:
+                # A request larger than the whole bucket can still go, once it's full
+                tokens = min(tokens, self.tpm)
+                self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60) - tokens
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens * 60 / self.tpm)
+            
+            return wait
+    
+    def acquire(self, tokens: int = 0):
+        """Block until a request of `tokens` tokens may be sent."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def aacquire(self, tokens: int = 0):
+        """Wait (without blocking the event loop) until a request may be sent."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether an SDK error is a rate limit or transient server error."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status in RETRYABLE_STATUS or type(error).__name__ == "RateLimitError"
+
+
+def backoff_delay(attempt: int) -> float:
+    """Jittered exponential backoff for retry `attempt` (0-based)."""
+    return min(2 ** attempt + random.random(), MAX_BACKOFF_SECONDS)
@@ -1,5 +1,7 @@
 """
 Auto-patching for LLM clients.
+
+For capture without patching, see agentra.patches.transport (needs httpx).
 """
 
 from .openai_patch import patch_openai, unpatch_openai
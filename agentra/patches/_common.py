@@ -0,0 +1,267 @@
+"""
+Helpers shared by the LLM client patches.
+"""
+
+import inspect
+import time
+from functools import wraps
+from typing import Callable
+
+from ..capture import CaptureContext, _current_ctx_var
+from ..types import LLMCall
+
+
+# Total message content kept per captured call; long histories are cut here
+MAX_CAPTURED_MSG_CHARS = 8192
+
+
+def snapshot_messages(messages, limit: int = MAX_CAPTURED_MSG_CHARS) -> list:
+    """
+    Copy of a call's messages, truncated to `limit` characters of content.
+    
+    The caller's list is never stored: it may be mutated after the call, and
+    a long conversation history would otherwise be kept alive per call.
+    Messages past the limit are dropped; the one crossing it is cut short.
+    """
+    out = []
+    used = 0
+    for message in messages or ():
+        if not isinstance(message, dict):
+            out.append(message)
+            continue
+        
+        message = dict(message)
+        content = message.get("content")
+        if isinstance(content, str):
+            if used + len(content) > limit:
+                message["content"] = content[:limit - used] + "...[truncated]"
+                out.append(message)
+                break
+            used += len(content)
+        out.append(message)
+    return out
+
+
+def wrap_create(original: Callable, extract: Callable, reduce_chunk: Callable) -> Callable:
+    """
+    Wrap an SDK create/completion function so calls made in a trace are recorded.
+    
+    Args:
+        original: The SDK function (also works for methods; self is in args)
+        extract: (kwargs, response, duration_ms) -> LLMCall
+        reduce_chunk: Folds one chunk of a stream=True response into the
+            stream state (see RecordingStream)
+    
+    Returns:
+        Drop-in replacement for original
+    """
+    @wraps(original)
+    def patched(*args, **kwargs):
+        # Nothing being traced: call straight through, untimed
+        if not CaptureContext._active_count:
+            return original(*args, **kwargs)
+        ctx = _current_ctx_var.get()
+        if ctx is None:
+            return original(*args, **kwargs)
+        
+        start = time.perf_counter()
+        
+        # Call original
+        response = original(*args, **kwargs)
+        
+        # Streams are recorded once the caller has consumed them
+        if kwargs.get("stream"):
+            return RecordingStream(response, ctx, kwargs, start, reduce_chunk)
+        
+        duration = (time.perf_counter() - start) * 1000
+        ctx.add_llm_call(extract(kwargs, response, duration))
+        
+        return response
+    
+    return patched
+
+
+def wrap_acreate(original: Callable, extract: Callable, reduce_chunk: Callable) -> Callable:
+    """Async counterpart of wrap_create(), for async SDK clients."""
+    @wraps(original)
+    async def patched(*args, **kwargs):
+        # Nothing being traced: call straight through, untimed
+        if not CaptureContext._active_count:
+            return await original(*args, **kwargs)
+        ctx = _current_ctx_var.get()
+        if ctx is None:
+            return await original(*args, **kwargs)
+        
+        start = time.perf_counter()
+        
+        # Call original
+        response = await original(*args, **kwargs)
+        
+        # Streams are recorded once the caller has consumed them
+        if kwargs.get("stream"):
+            return AsyncRecordingStream(response, ctx, kwargs, start, reduce_chunk)
+        
+        duration = (time.perf_counter() - start) * 1000
+        ctx.add_llm_call(extract(kwargs, response, duration))
+        
+        return response
+    
+    return patched
+
+
+class RecordingStream:
+    """
+    Stand-in for an SDK stream that records the call once it is consumed.
+    
+    Chunks are passed through to the caller unchanged while reduce_chunk
+    folds them into the final text and token counts. The LLMCall is added
+    when the stream is exhausted or closed, so duration_ms covers the
+    whole stream rather than time to first byte. A stream closed or
+    abandoned partway (or never read) is recorded with what it received,
+    at the latest when it is garbage collected, and flagged with
+    metadata["stream_incomplete"].
+    
+    Anything else (e.g. .response) is forwarded to the wrapped stream, and
+    __class__ reports the SDK's stream class so isinstance() checks on it
+    keep working.
+    """
+    
+    def __init__(self, stream, ctx, kwargs: dict, start: float, reduce_chunk: Callable[[dict, object], None]):
+        """
+        Args:
+            stream: Stream returned by the SDK
+            ctx: CaptureContext to record into
+            kwargs: Keyword arguments of the create() call
+            start: perf_counter() reading taken before the call
+            reduce_chunk: Updates the state dict (text, tokens_in,
+                tokens_out, model) from one chunk
+        """
+        self._stream = stream
+        self._iterator = self._iterate(stream)
+        self._ctx = ctx
+        self._kwargs = kwargs
+        self._start = start
+        self._reduce_chunk = reduce_chunk
+        self._state = {"text": [], "tokens_in": 0, "tokens_out": 0, "model": None}
+        self._recorded = False
+    
+    @property
+    def __class__(self):
+        return type(self._stream)
+    
+    @staticmethod
+    def _iterate(stream):
+        return iter(stream)
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        try:
+            chunk = next(self._iterator)
+        except StopIteration:
+            self._record()
+            raise
+        
+        self._reduce(chunk)
+        return chunk
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def __getattr__(self, name):
+        if name == "_stream":
+            raise AttributeError(name)  # Not set up yet (failed __init__)
+        return getattr(self._stream, name)
+    
+    def __del__(self):
+        # Abandoned before the end: record what arrived
+        if self.__dict__.get("_recorded") is False:
+            try:
+                self._record(complete=False)
+            except Exception:
+                pass
+    
+    def close(self):
+        close = getattr(self._stream, "close", None)
+        if close is not None:
+            close()
+        self._record(complete=False)  # No-op if already recorded at the end
+    
+    def _reduce(self, chunk):
+        try:
+            self._reduce_chunk(self._state, chunk)
+        except (AttributeError, IndexError, TypeError):
+            pass  # Unexpected chunk shape - never break the caller's stream
+    
+    def _record(self, complete: bool = True):
+        if self._recorded:
+            return
+        self._recorded = True
+        
+        state = self._state
+        duration = (time.perf_counter() - self._start) * 1000
+        self._ctx.add_llm_call(LLMCall(
+            model=state["model"] or self._kwargs.get("model", "unknown"),
+            messages=snapshot_messages(self._kwargs.get("messages")),
+            response="".join(state["text"]),
+            tokens_in=state["tokens_in"],
+            tokens_out=state["tokens_out"],
+            duration_ms=duration,
+            timestamp=time.time() - duration / 1000,  # When the call started
+            metadata={} if complete else {"stream_incomplete": True},
+        ))
+
+
+class AsyncRecordingStream(RecordingStream):
+    """RecordingStream for async SDK streams (async for / async with)."""
+    
+    @staticmethod
+    def _iterate(stream):
+        return stream.__aiter__()
+    
+    def __aiter__(self):
+        return self
+    
+    async def __anext__(self):
+        try:
+            chunk = await self._iterator.__anext__()
+        except StopAsyncIteration:
+            self._record()
+            raise
+        
+        self._reduce(chunk)
+        return chunk
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    async def close(self):
+        close = getattr(self._stream, "close", None)
+        if close is not None:
+            result = close()
+            if inspect.isawaitable(result):
+                await result
+        self._record(complete=False)
+
+
+def reduce_chat_chunk(state: dict, chunk):
+    """Fold an OpenAI-style chat.completion.chunk (OpenAI, LiteLLM) into state."""
+    if chunk.choices:
+        content = chunk.choices[0].delta.content
+        if content:
+            state["text"].append(content)
+    
+    # Only present on the final chunk (stream_options={"include_usage": True})
+    usage = getattr(chunk, "usage", None)
+    if usage:
+        state["tokens_in"] = getattr(usage, "prompt_tokens", 0) or 0
+        state["tokens_out"] = getattr(usage, "completion_tokens", 0) or 0
+    
+    state["model"] = state["model"] or getattr(chunk, "model", None)
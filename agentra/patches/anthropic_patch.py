@@ -3,88 +3,78 @@ Auto-patch Anthropic client to capture all LLM calls.
 """
 
 import time
-from functools import wraps
-from datetime import datetime
-from ..capture import CaptureContext
 from ..types import LLMCall
+from ._common import snapshot_messages, wrap_create, wrap_acreate
 
 
 _original_create = None
+_original_async_create = None
 _patched = False
 
 
 def patch_anthropic():
     """Patch Anthropic client to capture calls."""
-    global _original_create, _patched
+    global _original_create, _original_async_create, _patched
     
     if _patched:
         return
     
+    # Clients create their messages resource per instance, so patch the classes
     try:
-        import anthropic
-        
-        # Patch messages.create
-        _original_create = anthropic.Anthropic.messages.create
-        
-        def patched_create(self, *args, **kwargs):
-            ctx = CaptureContext.get_current()
-            start = time.time()
-            
-            # Call original
-            response = _original_create(self, *args, **kwargs)
-            
-            duration = (time.time() - start) * 1000
-            
-            # Capture if in traced context
-            if ctx:
-                ctx.add_llm_call(_extract_llm_call(kwargs, response, duration))
-            
-            return response
-        
-        anthropic.Anthropic.messages.create = patched_create
-        _patched = True
-        
+        from anthropic.resources import Messages
     except ImportError:
-        pass  # Anthropic not installed
+        return  # Anthropic not installed
     except Exception:
-        pass  # Other error
+        return  # Other error
+    
+    # Patch messages.create
+    _original_create = Messages.create
+    Messages.create = wrap_create(_original_create, _extract_llm_call, _reduce_event)
+    
+    # Patch async messages.create (imported on its own, so sync capture doesn't depend on it)
+    try:
+        from anthropic.resources import AsyncMessages
+    except ImportError:
+        AsyncMessages = None
+    if AsyncMessages is not None:
+        _original_async_create = AsyncMessages.create
+        AsyncMessages.create = wrap_acreate(_original_async_create, _extract_llm_call, _reduce_event)
+    
+    _patched = True
 
 
 def unpatch_anthropic():
     """Restore original Anthropic client."""
-    global _original_create, _patched
+    global _original_create, _original_async_create, _patched
     
     if _patched and _original_create:
-        import anthropic
-        anthropic.Anthropic.messages.create = _original_create
+        from anthropic.resources import Messages
+        Messages.create = _original_create
+        
+        if _original_async_create is not None:
+            from anthropic.resources import AsyncMessages
+            AsyncMessages.create = _original_async_create
+            _original_async_create = None
         _patched = False
 
 
 def _extract_llm_call(kwargs: dict, response, duration: float) -> LLMCall:
     """Extract LLMCall from Anthropic request/response."""
     
-    # Extract messages
-    messages = kwargs.get("messages", [])
+    # Extract messages (copied, so later edits by the caller don't leak in)
+    messages = snapshot_messages(kwargs.get("messages"))
     
-    # Extract response text with error handling
-    response_text = ""
-    try:
-        if hasattr(response, "content") and response.content:
-            if isinstance(response.content, list) and len(response.content) > 0:
-                if hasattr(response.content[0], "text"):
-                    response_text = response.content[0].text
-    except (IndexError, AttributeError, TypeError):
-        pass
+    # SDK responses are pydantic models; read them as one plain dict
+    data = response.model_dump() if hasattr(response, "model_dump") else response
+    if not isinstance(data, dict):
+        data = {}
     
-    # Extract token counts with error handling
-    tokens_in = 0
-    tokens_out = 0
-    try:
-        if hasattr(response, "usage") and response.usage:
-            tokens_in = getattr(response.usage, "input_tokens", 0)
-            tokens_out = getattr(response.usage, "output_tokens", 0)
-    except (AttributeError, TypeError):
-        pass
+    content = data.get("content") or [{}]
+    response_text = content[0].get("text") or ""
+    
+    usage = data.get("usage") or {}
+    tokens_in = usage.get("input_tokens") or 0
+    tokens_out = usage.get("output_tokens") or 0
     
     return LLMCall(
         model=kwargs.get("model", "unknown"),
@@ -93,6 +83,17 @@ def _extract_llm_call(kwargs: dict, response, duration: float) -> LLMCall:
         tokens_in=tokens_in,
         tokens_out=tokens_out,
         duration_ms=duration,
-        timestamp=datetime.now(),
+        timestamp=time.time() - duration / 1000,  # When the call started
     )
 
+
+def _reduce_event(state: dict, event):
+    """Fold one Anthropic streaming event into the stream state."""
+    if event.type == "message_start":
+        state["model"] = event.message.model
+        state["tokens_in"] = event.message.usage.input_tokens or 0
+    elif event.type == "content_block_delta":
+        if event.delta.type == "text_delta":
+            state["text"].append(event.delta.text)
+    elif event.type == "message_delta":
+        state["tokens_out"] = event.usage.output_tokens or 0
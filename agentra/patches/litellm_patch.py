@@ -3,10 +3,8 @@ Auto-patch LiteLLM to capture all LLM calls.
 """
 
 import time
-from functools import wraps
-from datetime import datetime
-from ..capture import CaptureContext
 from ..types import LLMCall
+from ._common import snapshot_messages, wrap_create, reduce_chat_chunk
 
 
 _original_completion = None
@@ -26,23 +24,7 @@ def patch_litellm():
         # Patch litellm.completion
         _original_completion = litellm.completion
         
-        @wraps(_original_completion)
-        def patched_completion(*args, **kwargs):
-            ctx = CaptureContext.get_current()
-            start = time.time()
-            
-            # Call original
-            response = _original_completion(*args, **kwargs)
-            
-            duration = (time.time() - start) * 1000
-            
-            # Capture if in traced context
-            if ctx:
-                ctx.add_llm_call(_extract_llm_call(kwargs, response, duration))
-            
-            return response
-        
-        litellm.completion = patched_completion
+        litellm.completion = wrap_create(_original_completion, _extract_llm_call, reduce_chat_chunk)
         _patched = True
         
     except ImportError:
@@ -62,28 +44,21 @@ def unpatch_litellm():
 def _extract_llm_call(kwargs: dict, response, duration: float) -> LLMCall:
     """Extract LLMCall from LiteLLM request/response."""
     
-    # Extract messages
-    messages = kwargs.get("messages", [])
+    # Extract messages (copied, so later edits by the caller don't leak in)
+    messages = snapshot_messages(kwargs.get("messages"))
     
-    # Extract response text with error handling
-    response_text = ""
-    try:
-        if hasattr(response, "choices") and response.choices:
-            choice = response.choices[0]
-            if hasattr(choice, "message") and choice.message:
-                response_text = choice.message.content or ""
-    except (IndexError, AttributeError, TypeError):
-        pass
+    # SDK responses are pydantic models; read them as one plain dict
+    data = response.model_dump() if hasattr(response, "model_dump") else response
+    if not isinstance(data, dict):
+        data = {}
     
-    # Extract token counts with error handling
-    tokens_in = 0
-    tokens_out = 0
-    try:
-        if hasattr(response, "usage") and response.usage:
-            tokens_in = getattr(response.usage, "prompt_tokens", 0)
-            tokens_out = getattr(response.usage, "completion_tokens", 0)
-    except (AttributeError, TypeError):
-        pass
+    choices = data.get("choices") or [{}]
+    message = choices[0].get("message") or {}
+    response_text = message.get("content") or ""
+    
+    usage = data.get("usage") or {}
+    tokens_in = usage.get("prompt_tokens") or 0
+    tokens_out = usage.get("completion_tokens") or 0
     
     return LLMCall(
         model=kwargs.get("model", "unknown"),
@@ -92,6 +67,6 @@ def _extract_llm_call(kwargs: dict, response, duration: float) -> LLMCall:
         tokens_in=tokens_in,
         tokens_out=tokens_out,
         duration_ms=duration,
-        timestamp=datetime.now(),
+        timestamp=time.time() - duration / 1000,  # When the call started
     )
 
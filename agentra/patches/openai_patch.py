@@ -3,10 +3,8 @@ Auto-patch OpenAI client to capture all LLM calls.
 """
 
 import time
-from functools import wraps
-from datetime import datetime
-from ..capture import CaptureContext
 from ..types import LLMCall
+from ._common import snapshot_messages, wrap_create, wrap_acreate, reduce_chat_chunk
 
 
 _original_create = None
@@ -21,71 +19,62 @@ def patch_openai():
     if _patched:
         return
     
+    # Clients create their chat resources per instance, so patch the classes
+    # (covers every OpenAI / AsyncOpenAI client, not just the module-level one)
     try:
-        import openai
-        
-        # Patch sync create
-        _original_create = openai.chat.completions.create
-        
-        @wraps(_original_create)
-        def patched_create(*args, **kwargs):
-            ctx = CaptureContext.get_current()
-            start = time.time()
-            
-            # Call original
-            response = _original_create(*args, **kwargs)
-            
-            duration = (time.time() - start) * 1000
-            
-            # Capture if in traced context
-            if ctx:
-                ctx.add_llm_call(_extract_llm_call(kwargs, response, duration))
-            
-            return response
-        
-        openai.chat.completions.create = patched_create
-        
-        _patched = True
-        
+        from openai.resources.chat import Completions
     except ImportError:
-        pass  # OpenAI not installed
+        return  # OpenAI not installed
+    
+    # Patch sync create
+    _original_create = Completions.create
+    Completions.create = wrap_create(_original_create, _extract_llm_call, reduce_chat_chunk)
+    
+    # Patch async create (imported on its own, so an SDK without it still gets sync capture)
+    try:
+        from openai.resources.chat import AsyncCompletions
+    except ImportError:
+        AsyncCompletions = None
+    if AsyncCompletions is not None:
+        _original_async_create = AsyncCompletions.create
+        AsyncCompletions.create = wrap_acreate(_original_async_create, _extract_llm_call, reduce_chat_chunk)
+    
+    _patched = True
 
 
 def unpatch_openai():
     """Restore original OpenAI client."""
-    global _original_create, _patched
+    global _original_create, _original_async_create, _patched
     
     if _patched and _original_create:
-        import openai
-        openai.chat.completions.create = _original_create
+        from openai.resources.chat import Completions
+        Completions.create = _original_create
+        
+        if _original_async_create is not None:
+            from openai.resources.chat import AsyncCompletions
+            AsyncCompletions.create = _original_async_create
+            _original_async_create = None
         _patched = False
 
 
 def _extract_llm_call(kwargs: dict, response, duration: float) -> LLMCall:
     """Extract LLMCall from OpenAI request/response."""
     
-    # Extract messages
-    messages = kwargs.get("messages", [])
+    # Extract messages (copied, so later edits by the caller don't leak in)
+    messages = snapshot_messages(kwargs.get("messages"))
     
-    # Extract response text with error handling
-    response_text = ""
-    try:
-        if hasattr(response, "choices") and response.choices:
-            choice = response.choices[0]
-            if hasattr(choice, "message") and choice.message:
-                response_text = choice.message.content or ""
-    except (IndexError, AttributeError, TypeError):
-        pass
+    # SDK responses are pydantic models; read them as one plain dict
+    data = response.model_dump() if hasattr(response, "model_dump") else response
+    if not isinstance(data, dict):
+        data = {}
     
-    # Extract token counts with error handling
-    tokens_in = 0
-    tokens_out = 0
-    try:
-        if hasattr(response, "usage") and response.usage:
-            tokens_in = getattr(response.usage, "prompt_tokens", 0)
-            tokens_out = getattr(response.usage, "completion_tokens", 0)
-    except (AttributeError, TypeError):
-        pass
+    choices = data.get("choices") or [{}]
+    message = choices[0].get("message") or {}
+    response_text = message.get("content") or ""
+    
+    usage = data.get("usage") or {}
+    tokens_in = usage.get("prompt_tokens") or 0
+    tokens_out = usage.get("completion_tokens") or 0
     
     return LLMCall(
         model=kwargs.get("model", "unknown"),
@@ -94,6 +83,6 @@ def _extract_llm_call(kwargs: dict, response, duration: float) -> LLMCall:
         tokens_in=tokens_in,
         tokens_out=tokens_out,
         duration_ms=duration,
-        timestamp=datetime.now(),
+        timestamp=time.time() - duration / 1000,  # When the call started
     )
 
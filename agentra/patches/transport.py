@@ -0,0 +1,183 @@
+"""
+Capture LLM calls at the HTTP transport layer.
+
+An alternative to patching SDK methods: give a client an httpx client
+whose transport records every chat request it sends.
+
+    client = openai.OpenAI(http_client=instrumented_client())
+    client = anthropic.Anthropic(http_client=instrumented_client())
+
+Requests are recognised by URL (OpenAI-compatible /chat/completions and
+Anthropic /messages) and parsed from the JSON bodies, so this keeps working
+across SDK versions and covers client instances the module-level patches
+don't reach. Streamed responses are recorded when the stream is closed.
+Don't combine it with auto-patching for the same calls, or they are
+recorded twice.
+"""
+
+import json
+import time
+from typing import Callable, Optional
+
+import httpx
+
+from ..capture import CaptureContext, _current_ctx_var
+from ..types import LLMCall
+from ._common import snapshot_messages
+
+
+class AgentraTransport(httpx.BaseTransport):
+    """httpx transport that records LLM calls into the current trace."""
+    
+    def __init__(self, transport: Optional[httpx.BaseTransport] = None):
+        """
+        Args:
+            transport: Transport that actually sends requests
+                (default: a new httpx.HTTPTransport)
+        """
+        self._transport = transport or httpx.HTTPTransport()
+    
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        ctx = _current_ctx_var.get() if CaptureContext._active_count else None
+        if ctx is None:
+            return self._transport.handle_request(request)
+        
+        start = time.perf_counter()
+        response = self._transport.handle_request(request)
+        
+        path = request.url.path
+        if not path.endswith(("/chat/completions", "/messages")):
+            return response
+        
+        try:
+            req_body = json.loads(request.content)
+        except (ValueError, httpx.RequestNotRead):
+            return response
+        
+        def record(resp_body: Optional[dict]):
+            duration = (time.perf_counter() - start) * 1000
+            call = _extract_from_url(path, req_body, resp_body, duration)
+            if call is not None:
+                ctx.add_llm_call(call)
+        
+        if response.headers.get("content-type", "").startswith("text/event-stream"):
+            response.stream = _RecordingStream(
+                response.stream,
+                lambda data: record(_reduce_stream(path, data)),
+            )
+            return response
+        
+        try:
+            resp_body = json.loads(response.read())
+        except ValueError:
+            resp_body = None
+        record(resp_body)
+        return response
+    
+    def close(self):
+        self._transport.close()
+
+
+def instrumented_client(**kwargs) -> httpx.Client:
+    """httpx.Client whose requests are captured; pass as an SDK's http_client."""
+    transport = kwargs.pop("transport", None)
+    return httpx.Client(transport=AgentraTransport(transport), **kwargs)
+
+
+class _RecordingStream(httpx.SyncByteStream):
+    """Passes a streamed body through, then hands the whole body to on_close."""
+    
+    def __init__(self, stream, on_close: Callable[[bytes], None]):
+        self._stream = stream
+        self._on_close = on_close
+        self._chunks: list[bytes] = []
+    
+    def __iter__(self):
+        for chunk in self._stream:
+            self._chunks.append(chunk)
+            yield chunk
+    
+    def close(self):
+        self._stream.close()
+        
+        on_close, self._on_close = self._on_close, None
+        if on_close is not None:
+            on_close(b"".join(self._chunks))
+
+
+def _extract_from_url(path: str, req_body: dict, resp_body: Optional[dict], duration: float) -> Optional[LLMCall]:
+    """Build an LLMCall from a chat request/response, routed by endpoint."""
+    if not isinstance(req_body, dict):
+        return None
+    if not isinstance(resp_body, dict):
+        resp_body = {}
+    usage = resp_body.get("usage") or {}
+    
+    if path.endswith("/chat/completions"):
+        # OpenAI-compatible
+        choices = resp_body.get("choices") or [{}]
+        message = choices[0].get("message") or {}
+        response_text = message.get("content") or ""
+        tokens_in = usage.get("prompt_tokens") or 0
+        tokens_out = usage.get("completion_tokens") or 0
+    
+    elif path.endswith("/messages"):
+        # Anthropic
+        response_text = "".join(
+            block.get("text", "")
+            for block in resp_body.get("content") or []
+            if block.get("type") == "text"
+        )
+        tokens_in = usage.get("input_tokens") or 0
+        tokens_out = usage.get("output_tokens") or 0
+    
+    else:
+        return None
+    
+    return LLMCall(
+        model=resp_body.get("model") or req_body.get("model", "unknown"),
+        messages=snapshot_messages(req_body.get("messages")),
+        response=response_text,
+        tokens_in=tokens_in,
+        tokens_out=tokens_out,
+        duration_ms=duration,
+        timestamp=time.time() - duration / 1000,  # When the call started
+    )
+
+
+def _reduce_stream(path: str, data: bytes) -> dict:
+    """Fold a server-sent event stream into the equivalent non-streamed response body."""
+    text = []
+    usage = {}
+    model = None
+    
+    for line in data.decode("utf-8", "replace").splitlines():
+        if not line.startswith("data:"):
+            continue
+        try:
+            event = json.loads(line[5:])
+        except ValueError:
+            continue  # e.g. "[DONE]"
+        if not isinstance(event, dict):
+            continue
+        
+        # OpenAI-compatible chunks
+        for choice in event.get("choices") or []:
+            text.append((choice.get("delta") or {}).get("content") or "")
+        
+        # Anthropic events
+        message = event.get("message")
+        if isinstance(message, dict):
+            model = message.get("model") or model
+            usage.update(message.get("usage") or {})
+        delta = event.get("delta")
+        if isinstance(delta, dict) and delta.get("type") == "text_delta":
+            text.append(delta.get("text", ""))
+        
+        model = event.get("model") or model
+        usage.update(event.get("usage") or {})
+    
+    response_text = "".join(text)
+    if path.endswith("/messages"):
+        return {"model": model, "content": [{"type": "text", "text": response_text}], "usage": usage}
+    return {"model": model, "choices": [{"message": {"content": response_text}}], "usage": usage}
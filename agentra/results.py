@@ -4,49 +4,199 @@ Save and load evaluation results.
 
 import json
 import os
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from dataclasses import asdict
+from dataclasses import fields, is_dataclass
+from typing import Any, Optional
 from .types import EvaluationResult, Status, CategoryResult, TraceResult
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Recently read modification times: path -> (st_mtime, time.monotonic() when read)
+_stat_cache: dict[str, tuple[float, float]] = {}
+_STAT_TTL_SECONDS = 1.0
+_STAT_CACHE_MAX = 1024
+
+# Results directories already created by this process
+_ensured_dirs: set[str] = set()
+
+# Shared background writer for save_result_async (created on first use)
+_save_executor: Optional[ThreadPoolExecutor] = None
+_save_executor_lock = threading.Lock()
+_SAVE_WORKERS = 4
+
+# Append-only log of saved results (one JSON summary per line, oldest first),
+# so listing and prefix lookups don't have to open every result file
+_INDEX_FILENAME = "index.jsonl"
+
+# Summary fields, written first in every result file so list_results can
+# parse them from the file's first _HEAD_BYTES
+_HEADER_FIELDS = ("name", "timestamp", "score", "status", "total_traces")
+_HEAD_BYTES = 4096
+
+_WS = re.compile(r"[ \t\n\r]*")
+_decoder = json.JSONDecoder()
+
+# Status by its saved value, without going through Enum.__call__ on every load
+_STATUS_BY_VALUE = {s.value: s for s in Status}
+
+# One left-aligned column of the compare_results table
+_COL = "{:<15}".format
+
 
 def save_result(
     result: EvaluationResult,
     name: str,
     results_dir: str = "agentra-results",
+    durable: bool = False,
 ) -> str:
     """
     Save evaluation result to JSON file.
     
+    The file is written under a temporary name and renamed into place, so
+    readers never see a partially written result.
+    
     Args:
         result: The evaluation result
         name: Name for this result (e.g., "auth-flow-test", "v2.1-regression")
         results_dir: Directory to save results
+        durable: fsync the file before renaming it into place, so it also
+            survives a power loss
     
     Returns:
         Path to saved file
     """
     
-    # Create directory if needed
-    Path(results_dir).mkdir(parents=True, exist_ok=True)
+    # Create directory if needed (once per directory per process)
+    if results_dir not in _ensured_dirs:
+        _results_path(results_dir).mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(results_dir)
     
     # Set name on result
     result.name = name
     
-    # Create filename with timestamp
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    # Create filename with timestamp (YYYYmmdd_HHMMSS, without going through strftime)
+    now = datetime.now()
+    timestamp = f"{now.year:04d}{now.month:02d}{now.day:02d}_{now.hour:02d}{now.minute:02d}{now.second:02d}"
     filename = f"{name}_{timestamp}.json"
     filepath = os.path.join(results_dir, filename)
     
-    # Convert to dict and save
+    # Built once; the file and the index entry share its summary fields
     data = _result_to_dict(result)
     
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    try:
+        _write_result(data, filepath, durable)
+    except FileNotFoundError:
+        # Directory was removed after we created it
+        _results_path(results_dir).mkdir(parents=True, exist_ok=True)
+        _write_result(data, filepath, durable)
     
+    _stat_cache.pop(os.path.normpath(filepath), None)
+    _append_index(data, filename, results_dir)
     return filepath
 
 
+def _append_index(data: dict, filename: str, results_dir: str):
+    """Record a saved result in the index; failures are ignored (the file is what counts)."""
+    entry = {
+        "name": data["name"],
+        "filename": filename,
+        "timestamp": data["timestamp"],
+        "score": data["score"],
+        "status": data["status"],
+        "traces": data["total_traces"],
+    }
+    if orjson is not None:
+        line = orjson.dumps(entry, default=str) + b"\n"
+    else:
+        line = (json.dumps(entry, default=str) + "\n").encode("utf-8")
+    
+    try:
+        # One write of one line in append mode, so concurrent saves don't interleave
+        with open(os.path.join(results_dir, _INDEX_FILENAME), "ab") as f:
+            f.write(line)
+    except OSError:
+        pass
+
+
+def _write_result(data: dict, filepath: str, durable: bool = False):
+    """Write a result's dict to a temporary file next to filepath, then rename it into place."""
+    tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        payload = _dumps(data)
+        if payload is not None:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+        else:
+            with open(tmp_path, "w") as f:
+                json.dump(data, f, indent=2, default=_json_default)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+        
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def save_result_async(
+    result: EvaluationResult,
+    name: str,
+    results_dir: str = "agentra-results",
+    executor: Optional[ThreadPoolExecutor] = None,
+) -> "Future[str]":
+    """
+    Save evaluation result on a background thread.
+    
+    Lets a regression suite go on to its next evaluation while the file is
+    written. Don't modify (or save) the result again until the returned
+    future is done.
+    
+    Args:
+        result: The evaluation result
+        name: Name for this result
+        results_dir: Directory to save results
+        executor: Executor to write with (default: a shared pool of
+            _SAVE_WORKERS threads)
+    
+    Returns:
+        Future resolving to the path of the saved file
+    """
+    if executor is None:
+        executor = _get_save_executor()
+    return executor.submit(save_result, result, name, results_dir)
+
+
+def _get_save_executor() -> ThreadPoolExecutor:
+    global _save_executor
+    
+    with _save_executor_lock:
+        if _save_executor is None:
+            # Pool threads are joined at interpreter exit, so pending saves still finish
+            _save_executor = ThreadPoolExecutor(
+                max_workers=_SAVE_WORKERS,
+                thread_name_prefix="agentra-save",
+            )
+        return _save_executor
+
+
 def load_result(name: str, results_dir: str = "agentra-results") -> EvaluationResult:
     """
     Load evaluation result from file.
@@ -59,7 +209,7 @@ def load_result(name: str, results_dir: str = "agentra-results") -> EvaluationRe
         EvaluationResult
     """
     
-    results_path = Path(results_dir)
+    results_path = _results_path(results_dir)
     
     if not results_path.exists():
         raise FileNotFoundError(f"Results directory not found: {results_dir}")
@@ -75,14 +225,27 @@ def load_result(name: str, results_dir: str = "agentra-results") -> EvaluationRe
         if exact_path.exists():
             return _load_from_path(exact_path)
     
-    # Find most recent matching prefix
-    matches = list(results_path.glob(f"{name}*.json"))
+    # Most recent save matching the prefix, according to the index
+    for entry in reversed(_read_index(results_dir)):
+        filename = entry.get("filename")
+        if isinstance(filename, str) and filename.startswith(name) and filename.endswith(".json"):
+            path = results_path / filename
+            if path.exists():
+                return _load_from_path(path)
+    
+    # Not indexed (e.g. saved before the index existed): find most recent matching prefix
+    with os.scandir(results_dir) as entries:
+        matches = [
+            e.path for e in entries
+            if e.name.startswith(name) and e.name.endswith(".json") and e.is_file()
+        ]
     if not matches:
         raise FileNotFoundError(f"No results found matching '{name}'")
     
-    # Sort by modification time, get most recent
-    most_recent = max(matches, key=lambda p: p.stat().st_mtime)
-    return _load_from_path(most_recent)
+    # Sort by modification time (one stat per file, at most), get most recent
+    dated = [(p, _mtime(p)) for p in matches]
+    most_recent = max(dated, key=itemgetter(1))[0]
+    return _load_from_path(Path(most_recent))
 
 
 def list_results(results_dir: str = "agentra-results") -> list[dict]:
@@ -93,26 +256,40 @@ def list_results(results_dir: str = "agentra-results") -> list[dict]:
         List of {name, filename, timestamp, score, status}
     """
     
-    results_path = Path(results_dir)
-    if not results_path.exists():
+    try:
+        with os.scandir(results_dir) as entries:
+            files = {e.name: e.path for e in entries if e.name.endswith(".json") and e.is_file()}
+    except FileNotFoundError:
         return []
     
-    results = []
-    for filepath in results_path.glob("*.json"):
+    # Indexed results are listed straight from the index (the last entry
+    # for a file wins; entries whose file was deleted are dropped)
+    indexed = {}
+    for entry in _read_index(results_dir):
+        filename = entry.get("filename")
+        if filename in files:
+            indexed[filename] = entry
+    results = list(indexed.values())
+    
+    # Anything else (saved before the index existed, copied in) is read from its file
+    for filename, filepath in files.items():
+        if filename in indexed:
+            continue
         try:
-            with open(filepath) as f:
-                data = json.load(f)
-            
-            results.append({
-                "name": data.get("name", filepath.stem),
-                "filename": filepath.name,
-                "timestamp": data.get("timestamp"),
-                "score": data.get("score"),
-                "status": data.get("status"),
-                "traces": data.get("total_traces"),
-            })
-        except:
-            pass
+            data = _read_header(filepath)
+        except (OSError, ValueError):
+            continue  # Unreadable, or not JSON
+        if not isinstance(data, dict):
+            continue
+        
+        results.append({
+            "name": data.get("name", filename[:-5]),
+            "filename": filename,
+            "timestamp": data.get("timestamp"),
+            "score": data.get("score"),
+            "status": data.get("status"),
+            "traces": data.get("total_traces"),
+        })
     
     # Sort by timestamp descending
     results.sort(key=lambda x: x["timestamp"] or "", reverse=True)
@@ -127,73 +304,229 @@ def compare_results(
     Compare multiple results and return comparison report.
     """
     
-    results = [load_result(name, results_dir) for name in names]
+    if len(names) <= 1:
+        results = [load_result(name, results_dir) for name in names]
+    else:
+        # Overlap the file reads
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as pool:
+            results = list(pool.map(lambda name: load_result(name, results_dir), names))
     
     lines = ["COMPARISON REPORT", "=" * 60, ""]
     
     # Header
-    header = f"{'Metric':<20}"
-    for r in results:
-        header += f"{r.name:<15}"
-    lines.append(header)
+    lines.append(f"{'Metric':<20}" + "".join(_COL(r.name) for r in results))
     lines.append("-" * 60)
     
     # Overall score
-    row = f"{'Overall Score':<20}"
-    for r in results:
-        row += f"{r.score:.0%:<15}"
-    lines.append(row)
+    lines.append(f"{'Overall Score':<20}" + "".join(_COL(f"{r.score:.0%}") for r in results))
     
     # Status
-    row = f"{'Status':<20}"
-    for r in results:
-        row += f"{r.status.value:<15}"
-    lines.append(row)
+    lines.append(f"{'Status':<20}" + "".join(_COL(r.status.value) for r in results))
     
     # Category scores
     lines.append("")
     lines.append("Category Scores:")
     
-    # Get all category names
-    cat_names = list(set(c.name for r in results for c in r.categories))
+    # Get all category names (in first-seen order) and index each result's categories by name
+    cat_names = list(dict.fromkeys(c.name for r in results for c in r.categories))
+    by_name = [{c.name: c for c in r.categories} for r in results]
     
     for cat_name in cat_names:
-        row = f"  {cat_name:<18}"
-        for r in results:
-            cat = next((c for c in r.categories if c.name == cat_name), None)
-            score = f"{cat.score:.0%}" if cat else "N/A"
-            row += f"{score:<15}"
-        lines.append(row)
+        cells = []
+        for cats in by_name:
+            cat = cats.get(cat_name)
+            cells.append(_COL(f"{cat.score:.0%}" if cat else "N/A"))
+        lines.append(f"  {cat_name:<18}" + "".join(cells))
     
     return "\n".join(lines)
 
 
+def _mtime(path) -> float:
+    """st_mtime of path, reusing a reading taken within the last _STAT_TTL_SECONDS."""
+    key = os.path.normpath(path)
+    now = time.monotonic()
+    cached = _stat_cache.get(key)
+    if cached is not None and now - cached[1] < _STAT_TTL_SECONDS:
+        return cached[0]
+    
+    mtime = os.stat(key).st_mtime
+    if len(_stat_cache) >= _STAT_CACHE_MAX:
+        _prune_stat_cache(now)
+    _stat_cache[key] = (mtime, now)
+    return mtime
+
+
+def _prune_stat_cache(now: float):
+    """Drop expired readings; if the cache is still full, drop the oldest half."""
+    # Work from snapshots (loads may run on several threads, see compare_results)
+    for key, (_, read_at) in list(_stat_cache.items()):
+        if now - read_at >= _STAT_TTL_SECONDS:
+            _stat_cache.pop(key, None)
+    
+    if len(_stat_cache) >= _STAT_CACHE_MAX:
+        # Dicts keep insertion order, so the first entries are the oldest readings
+        for key in list(_stat_cache)[:_STAT_CACHE_MAX // 2]:
+            _stat_cache.pop(key, None)
+
+
+@lru_cache(maxsize=8)
+def _results_path(results_dir: str) -> Path:
+    """Path for a results directory (there are only ever a few)."""
+    return Path(results_dir)
+
+
+@lru_cache(maxsize=256)
+def _parse_timestamp(value: str) -> datetime:
+    """datetime.fromisoformat, remembered (datetimes are immutable, so parses can be shared)."""
+    return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple:
+    """Names to serialize a dataclass under (a field's "export_as" metadata overrides its own)."""
+    return tuple(f.metadata.get("export_as", f.name) for f in fields(cls))
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    json.dump hook for traces and results.
+    
+    Dataclasses are expanded one level at a time as the encoder reaches
+    them, so no full dict copy of the tree is ever built.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {name: getattr(obj, name) for name in _field_names(type(obj))}
+    return str(obj)
+
+
+def _header_dict(result: EvaluationResult) -> dict:
+    """The summary fields of a result (_HEADER_FIELDS), converted to JSON values."""
+    timestamp = result.timestamp
+    return {
+        "name": result.name,
+        "timestamp": timestamp.isoformat() if isinstance(timestamp, datetime) else timestamp,
+        "score": result.score,
+        "status": result.status.value,
+        "total_traces": result.total_traces,
+    }
+
+
 def _result_to_dict(result: EvaluationResult) -> dict:
-    """Convert EvaluationResult to JSON-serializable dict."""
-    data = asdict(result)
+    """
+    Convert EvaluationResult to a dict for json.dump(default=_json_default).
     
-    # Convert Status enum to string
-    data["status"] = result.status.value
+    Only the top level is copied; nested dataclasses are expanded by the
+    encoder as it reaches them.
+    """
+    # Summary fields first (see _read_header), then the rest in declaration order
+    data = _header_dict(result)
+    for name in _field_names(EvaluationResult):
+        if name not in data:
+            data[name] = getattr(result, name)
+    return data
+
+
+def _dumps(data: dict):
+    """
+    Serialize a result's dict with orjson, which handles the nested
+    dataclasses natively. None if orjson is unavailable or rejects a value,
+    in which case the caller falls back to stdlib json.
+    """
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        )
+    except TypeError:
+        return None
+
+
+def _read_json(path) -> dict:
+    """Parse a JSON file (with orjson when available)."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path) as f:
+        return json.load(f)
+
+
+def _read_header(path) -> dict:
+    """
+    The summary fields of a result file.
     
-    # Convert datetime objects
-    if isinstance(result.timestamp, datetime):
-        data["timestamp"] = result.timestamp.isoformat()
+    They are parsed from the file's first _HEAD_BYTES when they lead it (as
+    save_result writes them), without touching the trace results after
+    them. Otherwise (e.g. files saved by older versions) the whole file is
+    parsed.
+    """
+    with open(path, "rb") as f:
+        head = f.read(_HEAD_BYTES)
+    if len(head) < _HEAD_BYTES:
+        return orjson.loads(head) if orjson is not None else json.loads(head)
+    
+    # Decode the leading top-level members one at a time until all summary
+    # fields are in; a value cut off by the end of the head raises ValueError
+    text = head.decode("utf-8", "ignore")
+    header = {}
+    try:
+        pos = _WS.match(text).end()
+        if text[pos:pos + 1] == "{":
+            pos += 1
+            while len(header) < len(_HEADER_FIELDS):
+                key, pos = _decoder.raw_decode(text, _WS.match(text, pos).end())
+                pos = _WS.match(text, pos).end()
+                if not isinstance(key, str) or text[pos:pos + 1] != ":":
+                    break
+                value, pos = _decoder.raw_decode(text, _WS.match(text, pos + 1).end())
+                if key in _HEADER_FIELDS:
+                    header[key] = value
+                pos = _WS.match(text, pos).end()
+                if text[pos:pos + 1] != ",":
+                    break
+                pos += 1
+    except ValueError:
+        pass
+    
+    if len(header) == len(_HEADER_FIELDS):
+        return header
+    return _read_json(path)
+
+
+def _read_index(results_dir: str) -> list[dict]:
+    """Entries of the results index, oldest first; unreadable lines are skipped."""
+    try:
+        with open(os.path.join(results_dir, _INDEX_FILENAME), "rb") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return []
     
-    return data
+    loads = orjson.loads if orjson is not None else json.loads
+    entries = []
+    for line in lines:
+        try:
+            entry = loads(line)
+        except ValueError:
+            continue  # e.g. a line cut short by a crash
+        if isinstance(entry, dict):
+            entries.append(entry)
+    return entries
 
 
 def _load_from_path(path: Path) -> EvaluationResult:
     """Load EvaluationResult from JSON file."""
-    with open(path) as f:
-        data = json.load(f)
+    data = _read_json(path)
     
     # Convert status string back to enum
     if "status" in data:
-        data["status"] = Status(data["status"])
+        status = data["status"]
+        data["status"] = _STATUS_BY_VALUE.get(status) or Status(status)
     
     # Convert timestamp string back to datetime
     if "timestamp" in data and isinstance(data["timestamp"], str):
-        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        data["timestamp"] = _parse_timestamp(data["timestamp"])
     
     # Reconstruct nested objects
     if "categories" in data:
@@ -202,13 +535,13 @@ def _load_from_path(path: Path) -> EvaluationResult:
         ]
     
     if "trace_results" in data:
-        data["trace_results"] = [
-            TraceResult(
-                **{k: v for k, v in tr.items() if k != "categories"},
-                categories=[CategoryResult(**cat) for cat in tr.get("categories", [])]
-            )
-            for tr in data["trace_results"]
-        ]
+        # The parsed dicts are ours, so swap their categories in place
+        # rather than copying each one minus "categories"
+        trace_results = []
+        for tr in data["trace_results"]:
+            tr["categories"] = [CategoryResult(**cat) for cat in tr.get("categories", [])]
+            trace_results.append(TraceResult(**tr))
+        data["trace_results"] = trace_results
     
     return EvaluationResult(**data)
 
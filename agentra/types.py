@@ -2,17 +2,24 @@
 Core data types for Agentra.
 """
 
+import sys
+import time
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
 from enum import Enum
 
 
+# Slotted dataclasses drop the per-instance __dict__ (Python 3.10+ only)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 # ─────────────────────────────────────────────────────────────────
 # TRACE DATA - What we capture
 # ─────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(**_SLOTS)
 class LLMCall:
     """Single LLM invocation."""
     model: str
@@ -21,11 +28,16 @@ class LLMCall:
     tokens_in: int = 0
     tokens_out: int = 0
     duration_ms: float = 0
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # Epoch seconds (see started_at)
     metadata: dict = field(default_factory=dict)  # agent_name, node_name, etc.
+    
+    @property
+    def started_at(self) -> datetime:
+        """The timestamp as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ToolCall:
     """Single tool/function call."""
     name: str
@@ -36,22 +48,62 @@ class ToolCall:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
-class AgentSpan:
-    """Tracks one agent's execution (for multi-agent systems)."""
+class _SpanLink:
+    """Back-reference from an AgentSpan to its Trace (a slot, so not a dataclass field)."""
+    __slots__ = ("_trace",)
+
+
+@dataclass(**_SLOTS)
+class AgentSpan(_SpanLink):
+    """
+    Tracks one agent's execution (for multi-agent systems).
+    
+    Calls made by the agent are stored once, on the Trace; the span keeps
+    their positions and resolves them through llm_calls / tool_calls.
+    Exports write the resolved calls, as before (see the "export_as" metadata).
+    """
     name: str
     role: Optional[str] = None
     start_time: datetime = field(default_factory=datetime.now)
     end_time: Optional[datetime] = None
-    llm_calls: list[LLMCall] = field(default_factory=list)
-    tool_calls: list[ToolCall] = field(default_factory=list)
+    llm_call_indices: list[int] = field(default_factory=list, metadata={"export_as": "llm_calls"})
+    tool_call_indices: list[int] = field(default_factory=list, metadata={"export_as": "tool_calls"})
     input: Any = None
     output: Any = None
     error: Optional[str] = None
+    
+    def __post_init__(self):
+        # Set by CaptureContext.start_agent_span
+        self._trace = None
+    
+    @property
+    def llm_calls(self) -> list[LLMCall]:
+        """LLM calls made while this was the innermost agent span."""
+        trace = self._trace
+        return trace.llm_calls_for(self) if trace is not None else []
+    
+    @property
+    def tool_calls(self) -> list[ToolCall]:
+        """Tool calls made while this was the innermost agent span."""
+        trace = self._trace
+        return trace.tool_calls_for(self) if trace is not None else []
+
+
+class _CaptureState:
+    """
+    Bookkeeping CaptureContext keeps on a Trace while capturing.
+    
+    Plain slots rather than dataclass fields, so none of it shows up in
+    export(), asdict(), repr or equality. Trace.__post_init__ sets it up.
+    """
+    __slots__ = (
+        "_agent_span_names",
+        "_tool_call_names",
+    )
 
 
-@dataclass
-class Trace:
+@dataclass(**_SLOTS)
+class Trace(_CaptureState):
     """Complete trace of one execution."""
     id: str
     name: Optional[str] = None  # User-provided name for this run
@@ -71,29 +123,66 @@ class Trace:
     framework: Optional[str] = None  # "crewai", "langchain", etc.
     metadata: dict = field(default_factory=dict)
     
+    def __post_init__(self):
+        # Name columns kept parallel to agent_spans / tool_calls by CaptureContext,
+        # so coverage scans never touch the span objects themselves
+        self._agent_span_names = []
+        self._tool_call_names = []
+    
     @property
     def total_tokens(self) -> int:
+        # Summed when read: LLMCalls may still be changed after they are recorded
         return sum(c.tokens_in + c.tokens_out for c in self.llm_calls)
     
+    @property
+    def tool_error_count(self) -> int:
+        """Number of tool calls that failed."""
+        return sum(1 for tc in self.tool_calls if tc.error)
+    
+    def tool_stats(self) -> tuple[int, float, Counter]:
+        """
+        (failed calls, total duration_ms, tool name -> calls) over tool_calls.
+        
+        Counted in one pass when read, since ToolCalls may still be
+        changed after they are recorded.
+        """
+        errors = 0
+        total_duration = 0
+        counts = Counter()
+        for tc in self.tool_calls:
+            if tc.error:
+                errors += 1
+            total_duration += tc.duration_ms
+            counts[tc.name] += 1
+        return errors, total_duration, counts
+    
     @property 
     def total_cost(self) -> float:
         # Rough estimate - can be made more accurate
         return self.total_tokens * 0.00001
+    
+    def llm_calls_for(self, span: AgentSpan) -> list[LLMCall]:
+        """LLM calls made while `span` was the innermost agent span."""
+        return [self.llm_calls[i] for i in span.llm_call_indices]
+    
+    def tool_calls_for(self, span: AgentSpan) -> list[ToolCall]:
+        """Tool calls made while `span` was the innermost agent span."""
+        return [self.tool_calls[i] for i in span.tool_call_indices]
 
 
 # ─────────────────────────────────────────────────────────────────
 # EVALUATION RESULTS
 # ─────────────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Score:
-    """Single evaluation score."""
+    """Single evaluation score (immutable; the judge may share instances)."""
     value: float  # 0.0 to 1.0
     reason: str
-    details: dict = field(default_factory=dict)
+    details: Optional[dict] = None  # None rather than {} saves a dict per Score
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CategoryResult:
     """Results for one evaluation category."""
     name: str
@@ -103,7 +192,7 @@ class CategoryResult:
     issues: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TraceResult:
     """Evaluation result for a single trace."""
     trace_id: str
@@ -125,7 +214,7 @@ class Status(Enum):
     POOR = "poor"            # < 0.6
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EvaluationResult:
     """Complete evaluation results."""
     name: str  # Result file name
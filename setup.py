@@ -41,6 +41,7 @@ setup(
         "langgraph": ["langgraph>=0.0.1"],
         "autogen": ["pyautogen>=0.2.0"],
         "litellm": ["litellm>=1.0.0"],
+        "orjson": ["orjson>=3.0.0"],
         "all": [
             "openai>=1.0.0",
             "anthropic>=0.18.0",
@@ -50,6 +51,7 @@ setup(
             "langgraph>=0.0.1",
             "pyautogen>=0.2.0",
             "litellm>=1.0.0",
+            "orjson>=3.0.0",
         ],
     },
 )
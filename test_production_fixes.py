@@ -135,6 +135,10 @@ def test_judge_parsing():
             score = judge._parse_response(response)
             assert 0.0 <= score.value <= 1.0, f"Score {score.value} out of range"
         
+        # The reason is the REASON line only, not everything after it
+        score = judge._parse_response("SCORE: 0.7\nREASON: looks fine\nExtra trailing notes")
+        assert score.reason == "looks fine", f"Unexpected reason: {score.reason!r}"
+        
         print("✓ Judge parsing handles various formats")
         return True
     except ImportError:
@@ -194,6 +198,208 @@ def test_error_handling():
         return False
 
 
+def test_rate_limiter():
+    """Test that the judge rate limiter goes into debt and waits it off."""
+    print("\nTesting judge rate limiter...")
+    try:
+        import time
+        from agentra.judge_ratelimit import RateLimiter
+        
+        # The bucket starts full, so the first rpm requests go straight out
+        limiter = RateLimiter(rpm=1200)
+        waits = [limiter._reserve(0) for _ in range(1200)]
+        assert all(w == 0 for w in waits), "Full bucket should not wait"
+        
+        # The next one is one request in debt: 60s / 1200 = 0.05s
+        wait = limiter._reserve(0)
+        assert 0.04 < wait <= 0.05, f"Unexpected wait {wait}"
+        
+        # Debt accumulates, so concurrent callers queue behind each other
+        start = time.monotonic()
+        limiter.acquire()
+        elapsed = time.monotonic() - start
+        assert elapsed >= 0.05, f"acquire() returned after {elapsed:.3f}s"
+        
+        # Token debt is tracked separately from request debt
+        limiter = RateLimiter(tpm=6000)
+        assert limiter._reserve(6000) == 0
+        wait = limiter._reserve(600)
+        assert 5.9 < wait <= 6.0, f"Unexpected token wait {wait}"
+        
+        # No limits means never waiting
+        assert RateLimiter()._reserve(10 ** 6) == 0
+        
+        print("✓ Rate limiter waits off request and token debt")
+        return True
+    except Exception as e:
+        print(f"✗ Rate limiter test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_judge_cache():
+    """Test the on-disk judge response cache."""
+    print("\nTesting judge response cache...")
+    try:
+        import os
+        import tempfile
+        from agentra.judge_cache import FileCache, cache_key
+        
+        # Keys are stable, and differ by model, temperature and prompt
+        key = cache_key("gpt-4o-mini", "prompt", 0.0)
+        assert key == cache_key("gpt-4o-mini", "prompt", 0.0), "Key not stable"
+        assert key != cache_key("gpt-4o", "prompt", 0.0), "Model not in key"
+        assert key != cache_key("gpt-4o-mini", "prompt", 0.7), "Temperature not in key"
+        assert key != cache_key("gpt-4o-mini", "other prompt", 0.0), "Prompt not in key"
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = FileCache(os.path.join(tmp, "judge_cache"))
+            
+            # Miss before the directory even exists
+            assert cache.get(key) is None, "Expected a miss"
+            
+            cache.set(key, {"raw_response": "SCORE: 0.9\nREASON: ok"})
+            assert cache.get(key) == {"raw_response": "SCORE: 0.9\nREASON: ok"}, "Expected a hit"
+            
+            # Same prompt at another temperature is still a miss
+            assert cache.get(cache_key("gpt-4o-mini", "prompt", 0.7)) is None
+            
+            # A second cache over the same directory sees the entry
+            assert FileCache(os.path.join(tmp, "judge_cache")).get(key) is not None
+            
+            # Only the entry is left behind, no temporary files
+            assert os.listdir(os.path.join(tmp, "judge_cache")) == [f"{key}.json"]
+        
+        print("✓ Judge cache hits and misses keyed on model/temperature/prompt")
+        return True
+    except Exception as e:
+        print(f"✗ Judge cache test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_results_index():
+    """Test listing and loading saved results through the results index."""
+    print("\nTesting results index...")
+    try:
+        import json
+        import os
+        import shutil
+        import tempfile
+        from datetime import datetime, timedelta
+        from agentra import EvaluationResult, Status
+        from agentra.results import save_result, load_result, list_results
+        
+        def make_result(score, timestamp):
+            return EvaluationResult(
+                name="", system_name="index-test", score=score, status=Status.GOOD,
+                categories=[], trace_results=[], summary="", issues=[], recommendations=[],
+                total_traces=1, total_llm_calls=0, total_tool_calls=0, total_tokens=0,
+                total_duration_ms=0.0, agents_observed=[], tools_observed=[],
+                timestamp=timestamp,
+            )
+        
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        with tempfile.TemporaryDirectory() as tmp:
+            results_dir = os.path.join(tmp, "results")
+            
+            # "run" is a prefix of "run-v2"; the later save is the latest match
+            first = save_result(make_result(0.8, start), "run", results_dir)
+            second = save_result(make_result(0.9, start + timedelta(minutes=1)), "run-v2", results_dir)
+            assert os.path.exists(os.path.join(results_dir, "index.jsonl")), "Index not written"
+            assert load_result("run", results_dir).score == 0.9, "Expected the latest prefix match"
+            assert load_result("run-v2", results_dir).name == "run-v2"
+            
+            # A result copied in from elsewhere is not indexed but still listed
+            copied = os.path.join(results_dir, "copied_20230101_000000.json")
+            shutil.copy(first, copied)
+            with open(copied, encoding="utf-8") as f:
+                data = json.load(f)
+            data["name"] = "copied"
+            data["timestamp"] = (start - timedelta(days=1)).isoformat()
+            with open(copied, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            
+            listed = list_results(results_dir)
+            assert [r["name"] for r in listed] == ["run-v2", "run", "copied"], listed
+            assert listed[0]["score"] == 0.9 and listed[0]["traces"] == 1, listed[0]
+            assert listed[2]["status"] == "good", listed[2]
+            
+            # A deleted file drops out of the listing even though it is indexed
+            os.remove(second)
+            listed = list_results(results_dir)
+            assert [r["name"] for r in listed] == ["run", "copied"], listed
+            assert load_result("run", results_dir).score == 0.8, "Deleted file still loaded"
+        
+        print("✓ Results listed from the index and loaded by latest match")
+        return True
+    except Exception as e:
+        print(f"✗ Results index test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def test_async_batch():
+    """Test that run_batch keeps one trace per concurrent task."""
+    print("\nTesting async batch runs...")
+    try:
+        import asyncio
+        from agentra import Agentra
+        from agentra.capture import CaptureContext
+        from agentra.types import ToolCall
+        
+        agentra = Agentra("batch-test", auto_patch=False)
+        
+        async def agent(query: str) -> str:
+            # Interleave with the other tasks between recording steps
+            for step in range(3):
+                await asyncio.sleep(0)
+                CaptureContext.get_current().add_tool_call(
+                    ToolCall(name=f"search-{query}", input={"step": step})
+                )
+            return f"Answer to {query}"
+        
+        queries = ["a", "b", "c"]
+        outputs = asyncio.run(agentra.run_batch([agent(q) for q in queries]))
+        assert outputs == [f"Answer to {q}" for q in queries], outputs
+        
+        traces = agentra.get_traces()
+        assert len(traces) == 3, f"Expected 3 traces, got {len(traces)}"
+        assert len({t.id for t in traces}) == 3, "Traces share an id"
+        for trace in traces:
+            query = trace.output[-1]
+            names = {c.name for c in trace.tool_calls}
+            assert names == {f"search-{query}"}, f"Trace for {query!r} has calls {names}"
+            assert len(trace.tool_calls) == 3, f"Trace for {query!r} has {len(trace.tool_calls)} calls"
+        
+        # Nothing is left on the caller's context afterwards
+        assert CaptureContext.get_current() is None, "Batch leaked a capture context"
+        
+        # A failing task is returned as its exception, the others still complete
+        async def failing(query: str) -> str:
+            raise ValueError(query)
+        
+        outputs = asyncio.run(agentra.run_batch([agent("d"), failing("e")], return_exceptions=True))
+        assert outputs[0] == "Answer to d" and isinstance(outputs[1], ValueError), outputs
+        assert agentra.get_traces()[3].output == "Answer to d", "Completed task not traced"
+        
+        try:
+            asyncio.run(agentra.evaluate_async())
+        except ImportError as e:
+            print(f"⚠ Async evaluation skipped (LLM client not installed): {e}")
+        
+        print("✓ run_batch records a separate trace per task")
+        return True
+    except Exception as e:
+        print(f"✗ Async batch test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
 def main():
     """Run all tests."""
     print("=" * 70)
@@ -206,6 +412,10 @@ def main():
         ("Evaluation", test_evaluation),
         ("Judge Parsing", test_judge_parsing),
         ("Error Handling", test_error_handling),
+        ("Rate Limiter", test_rate_limiter),
+        ("Judge Cache", test_judge_cache),
+        ("Results Index", test_results_index),
+        ("Async Batch", test_async_batch),
     ]
     
     results = []